@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 """Run the ThreeDLLM API server."""
 
+import os
+
 import uvicorn
 
 if __name__ == "__main__":
+    dev = os.environ.get("THREEDLLM_DEV", "").lower() in ("1", "true", "yes")
     uvicorn.run(
         "threedllm.api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        reload=dev,
+        workers=1 if dev else int(os.environ.get("WORKERS", "1")),
     )
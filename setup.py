@@ -21,14 +21,12 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Topic :: Scientific/Engineering :: Artificial Intelligence",
         "Topic :: Multimedia :: Graphics :: 3D Modeling",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=[
         "torch>=1.13.0",
         "numpy>=1.20.0",
@@ -36,9 +34,16 @@ setup(
         "uvicorn[standard]>=0.24.0",
         "python-multipart>=0.0.6",
         "pydantic>=2.0.0",
+        "orjson>=3.9.0",
         # shap-e must be installed separately: pip install git+https://github.com/openai/shap-e.git
     ],
     extras_require={
+        # Opt-in HTTP/2 client for the API generators and VLM providers;
+        # without it they fall back to requests.
+        "http2": [
+            "httpx>=0.24.0",
+            "h2>=4.0.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -1,13 +1,23 @@
 """FastAPI application for ThreeDLLM."""
 
+import asyncio
 import os
+import shutil
 import tempfile
 from pathlib import Path
 from typing import Optional
 
-from fastapi import FastAPI, File, Form, HTTPException, UploadFile, status
+from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
+
+try:
+    import orjson  # noqa: F401
+
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    # orjson not installed; stdlib encoder is the fallback
+    DefaultResponse = JSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from threedllm import __version__
@@ -28,20 +38,34 @@ app = FastAPI(
     title="ThreeDLLM API",
     description="REST API for generating 3D objects from text prompts using VLM-enhanced generation",
     version=__version__,
+    # orjson encodes the small, frequent /api/tasks poll responses several
+    # times faster than the stdlib encoder
+    default_response_class=DefaultResponse,
 )
 
-# CORS middleware
+# CORS middleware. Set ALLOWED_ORIGINS (comma-separated) in production;
+# the wildcard default is kept for local development only.
+_allowed_origins = [
+    origin.strip()
+    for origin in os.environ.get("ALLOWED_ORIGINS", "*").split(",")
+    if origin.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # In production, specify actual origins
+    allow_origins=_allowed_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
 # Initialize components (lazy loading)
 _vlm: Optional[OpenAIProvider] = None
 
+# Serializes one-time initialization so concurrent callers don't race the
+# first model load.
+_init_lock = asyncio.Lock()
+
 
 def get_generator(generator_type: str = None) -> Generator3D:
     """
@@ -129,6 +153,31 @@ def get_pipeline(generator_type: str = None) -> ThreeDPipeline:
     return ThreeDPipeline(generator=generator, vlm=_vlm)
 
 
+@app.on_event("startup")
+async def warm_pipeline():
+    """Pre-warm the default generator and VLM at startup.
+
+    Loading Shap-E weights on the first /api/generate request adds
+    multi-second latency and can thundering-herd if several requests
+    arrive before initialization completes.
+    """
+    async with _init_lock:
+        try:
+            # Run the heavy constructor off the event loop
+            await asyncio.to_thread(get_pipeline)
+            print("[API] Pipeline warmed up at startup", flush=True)
+        except RuntimeError as e:
+            # Generator unavailable (e.g. missing deps/keys); first request
+            # will report the same error via the normal path.
+            print(f"[API] Startup warm-up skipped: {e}", flush=True)
+
+
+@app.on_event("shutdown")
+async def drain_tasks():
+    """Drain in-flight generations before the process exits."""
+    await task_manager.aclose()
+
+
 @app.get("/api/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint."""
@@ -168,6 +217,14 @@ async def generate_3d(
     This endpoint accepts form data and returns a task ID for async processing.
     """
     try:
+        # Back-pressure: reject instead of queueing unboundedly
+        if task_manager.is_saturated():
+            raise HTTPException(
+                status_code=429,
+                detail="Server is at capacity. Please retry later.",
+                headers={"Retry-After": "30"},
+            )
+
         # Log the generator being used for debugging
         print(f"[API] Request received - generator parameter: '{generator}'", flush=True)
         
@@ -187,13 +244,16 @@ async def generate_3d(
         # Handle image upload
         image_path = None
         if image and image.filename and image.size > 0:
-            # Save uploaded image to temp file
+            # Stream the upload straight to a temp file instead of buffering
+            # the whole image in memory first.
             suffix = Path(image.filename).suffix if image.filename else ".png"
-            content = await image.read()
-            if len(content) > 0:  # Ensure file has content
+
+            def save_upload() -> str:
                 with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-                    tmp.write(content)
-                    image_path = tmp.name
+                    shutil.copyfileobj(image.file, tmp, length=1 << 20)
+                    return tmp.name
+
+            image_path = await asyncio.to_thread(save_upload)
 
         # Create generation config
         config = GenerationConfig(
@@ -235,6 +295,13 @@ async def generate_3d_json(request: GenerationRequest):
     This is an alternative endpoint that accepts JSON instead of form data.
     """
     try:
+        if task_manager.is_saturated():
+            raise HTTPException(
+                status_code=429,
+                detail="Server is at capacity. Please retry later.",
+                headers={"Retry-After": "30"},
+            )
+
         pipeline = get_pipeline(generator_type=request.generator)
 
         config = GenerationConfig(
@@ -259,6 +326,8 @@ async def generate_3d_json(request: GenerationRequest):
             message="Generation task created",
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -272,8 +341,36 @@ async def get_task_status(task_id: str):
     return status_response
 
 
+@app.get("/api/tasks/{task_id}/stream")
+async def stream_task_status(task_id: str):
+    """Stream task progress as Server-Sent Events.
+
+    Pushes an update whenever the task state changes, replacing 1 Hz
+    client polling of /api/tasks/{task_id}.
+    """
+    status_response = await task_manager.get_task_status(task_id)
+    if not status_response:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    async def event_stream():
+        while True:
+            # Snapshot before reading state: the yield below can suspend
+            # on client backpressure, and a publish landing in that gap
+            # must not be lost (wait_for_update compares versions).
+            version = task_manager.get_version(task_id)
+            status_response = await task_manager.get_task_status(task_id)
+            if not status_response:
+                break
+            yield f"data: {status_response.model_dump_json()}\n\n"
+            if status_response.status in ("completed", "failed"):
+                break
+            await task_manager.wait_for_update(task_id, last_version=version)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 @app.get("/api/files/{filename}")
-async def download_file(filename: str):
+async def download_file(filename: str, request: Request):
     """Download a generated file."""
     file_path = task_manager.output_dir / filename
     if not file_path.exists() or not file_path.is_file():
@@ -285,10 +382,18 @@ async def download_file(filename: str):
     except ValueError:
         raise HTTPException(status_code=403, detail="Access denied")
 
+    # Meshes can be tens of MB; a weak ETag lets repeat downloads short-
+    # circuit to a body-less 304.
+    stat = file_path.stat()
+    etag = f'W/"{stat.st_size}-{int(stat.st_mtime)}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
     return FileResponse(
         path=str(file_path),
         filename=filename,
         media_type="application/octet-stream",
+        headers={"ETag": etag, "Cache-Control": "public, max-age=3600"},
     )
 
 
@@ -1,15 +1,25 @@
 """Server entry point for ThreeDLLM API."""
 
+import os
+
 import uvicorn
 
 
 def main():
-    """Main entry point for the server."""
+    """Main entry point for the server.
+
+    Runs with uvloop + httptools and no reloader by default; set
+    THREEDLLM_DEV=1 for auto-reload during development.
+    """
+    dev = os.environ.get("THREEDLLM_DEV", "").lower() in ("1", "true", "yes")
     uvicorn.run(
         "threedllm.api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        reload=dev,
+        workers=1 if dev else int(os.environ.get("WORKERS", "1")),
     )
 
 
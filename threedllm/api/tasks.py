@@ -1,7 +1,14 @@
 """Task management for async 3D generation."""
 
 import asyncio
+import concurrent.futures
+import hashlib
+import os
+import shutil
+import sys
+import traceback
 import uuid
+from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
 from typing import Dict, Optional
 
@@ -16,32 +23,182 @@ from threedllm.pipeline import ThreeDPipeline
 from threedllm.vlm.base import VLMProvider
 
 
+# Dispatch table so only the requested exporter is instantiated.
+_EXPORTER_CLASSES = {
+    "xyz": XYZExporter,
+    "obj": OBJExporter,
+    "ply": PLYExporter,
+    "stl": STLExporter,
+}
+
+
+def _cache_key(
+    prompt: str,
+    config: Optional[GenerationConfig],
+    format: str,
+    max_points: Optional[int],
+    generator: str,
+) -> str:
+    """Content hash identifying one (prompt, config, format, backend) render.
+
+    The generator name must be part of the key — /api/generate lets each
+    request pick its backend, and identical prompts rendered by different
+    backends are different meshes.
+    """
+    cfg = asdict(config) if config else None
+    raw = repr((prompt, cfg, format, max_points, generator)).encode("utf-8")
+    return hashlib.blake2b(raw).hexdigest()[:16]
+
+
+# Generator cached per worker process so each child loads models once.
+_child_generator = None
+
+
+def _generate_in_subprocess(prompt, config, device):
+    """Run Shap-E generation in a worker process.
+
+    Module-level so it pickles for ProcessPoolExecutor. Torch inference on
+    threads serializes under the GIL; separate processes give true N-way
+    parallelism.
+    """
+    global _child_generator
+    if _child_generator is None:
+        from threedllm.generators.shap_e import ShapEGenerator
+
+        _child_generator = ShapEGenerator(device=device)
+    return _child_generator.generate(prompt, config)
+
+
+@dataclass(slots=True)
+class TaskState:
+    """Mutable state for a single generation task.
+
+    Progress updates assign attributes directly: each task owns its own
+    record, so no lock is needed for per-task writes under the GIL. The
+    manager lock only guards insertion into the shared tasks dict.
+    """
+
+    status: str = "pending"
+    progress: float = 0.0
+    message: str = "Task created"
+    result_path: Optional[str] = None
+    error: Optional[str] = None
+    updated: asyncio.Event = field(default_factory=asyncio.Event)
+    """Pulsed by the writer on every milestone so watchers can await
+    progress instead of polling."""
+    version: int = 0
+    """Incremented on every publish. Watchers snapshot it before doing
+    anything that can suspend (e.g. an SSE yield) and pass it back to
+    wait_for_update, so a pulse landing in between is not lost."""
+
+
 class TaskManager:
-    """Manages async 3D generation tasks."""
+    """Manages async 3D generation tasks.
 
-    def __init__(self, output_dir: str = "outputs"):
+    Task state lives in an in-process dict by default. Set
+    THREEDLLM_REDIS_URL to mirror state into Redis so status polls work
+    across multiple uvicorn workers and survive restarts; completed tasks
+    expire after THREEDLLM_TASK_TTL seconds (default 24h).
+    """
+
+    def __init__(self, output_dir: str = "outputs", redis_url: Optional[str] = None):
         """
         Initialize task manager.
 
         Args:
             output_dir: Directory to store generated files.
+            redis_url: Optional Redis URL for shared task state
+                (defaults to THREEDLLM_REDIS_URL env var).
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
-        self.tasks: Dict[str, Dict] = {}
+        # Finished exports keyed by content hash, so identical requests
+        # reuse a previous render instead of re-running the whole pipeline.
+        self.cache_dir = self.output_dir / "cache"
+        self.cache_dir.mkdir(exist_ok=True)
+        self.tasks: Dict[str, TaskState] = {}
         self._lock = asyncio.Lock()
+        self.redis_url = redis_url or os.environ.get("THREEDLLM_REDIS_URL")
+        self.task_ttl = int(os.environ.get("THREEDLLM_TASK_TTL", str(24 * 3600)))
+        self._redis = None
+        # Bounded pool for local (GPU/CPU-bound) generation. Workers are
+        # spawned lazily on first submit.
+        self.max_concurrent = max(1, int(os.environ.get("THREEDLLM_MAX_CONCURRENT", "1")))
+        self._gen_executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.max_concurrent
+        )
+        # Admission control: at most THREEDLLM_MAX_INFLIGHT tasks actually
+        # run at once; beyond twice that depth new submissions are rejected
+        # so the queue (and held MeshResults) cannot grow unboundedly.
+        self.max_inflight = max(1, int(os.environ.get("THREEDLLM_MAX_INFLIGHT", "2")))
+        self._admit = asyncio.Semaphore(self.max_inflight)
+        self._inflight = 0
+        # References to running background tasks so shutdown can drain them.
+        self._bg_tasks: set = set()
+        self._closing = False
+
+    def _get_redis(self):
+        """Get or create the async Redis client."""
+        if self._redis is None:
+            try:
+                import redis.asyncio as redis
+            except ImportError:
+                raise RuntimeError(
+                    "THREEDLLM_REDIS_URL is set but redis is not installed. "
+                    "Install with: pip install redis"
+                )
+            self._redis = redis.from_url(self.redis_url, decode_responses=True)
+        return self._redis
+
+    async def _publish_task(self, task_id: str, task: TaskState) -> None:
+        """Notify watchers of a state change and mirror it into Redis."""
+        # Wake any SSE streams awaiting this task's next update
+        task.version += 1
+        task.updated.set()
+        task.updated.clear()
+        if not self.redis_url:
+            return
+        r = self._get_redis()
+        key = f"task:{task_id}"
+        await r.hset(
+            key,
+            mapping={
+                "status": task.status,
+                "progress": task.progress,
+                "message": task.message,
+                "result_path": task.result_path or "",
+                "error": task.error or "",
+            },
+        )
+        await r.expire(key, self.task_ttl)
+
+    async def _fetch_task(self, task_id: str) -> Optional[TaskState]:
+        """Fetch a task from Redis (for polls landing on another worker)."""
+        if not self.redis_url:
+            return None
+        data = await self._get_redis().hgetall(f"task:{task_id}")
+        if not data:
+            return None
+        return TaskState(
+            status=data.get("status", "pending"),
+            progress=float(data.get("progress", 0.0)),
+            message=data.get("message", ""),
+            result_path=data.get("result_path") or None,
+            error=data.get("error") or None,
+        )
 
     def _get_exporter(self, format_name: str, max_points: Optional[int] = None, seed: Optional[int] = None) -> Exporter3D:
         """Get exporter by format name."""
-        exporters = {
-            "xyz": XYZExporter(max_points=max_points, seed=seed),
-            "obj": OBJExporter(),
-            "ply": PLYExporter(),
-            "stl": STLExporter(),
-        }
-        if format_name not in exporters:
+        cls = _EXPORTER_CLASSES.get(format_name)
+        if cls is None:
             raise ValueError(f"Unknown format: {format_name}")
-        return exporters[format_name]
+        if cls is XYZExporter:
+            return cls(max_points=max_points, seed=seed)
+        return cls()
+
+    def is_saturated(self) -> bool:
+        """Whether the task backlog is deep enough to reject new work."""
+        return self._closing or self._inflight >= self.max_inflight * 2
 
     async def create_task(
         self,
@@ -60,17 +217,18 @@ class TaskManager:
             Task ID.
         """
         task_id = str(uuid.uuid4())
+        task = TaskState()
         async with self._lock:
-            self.tasks[task_id] = {
-                "status": "pending",
-                "progress": 0.0,
-                "message": "Task created",
-                "result_path": None,
-                "error": None,
-            }
-
-        # Start task in background
-        asyncio.create_task(
+            self.tasks[task_id] = task
+        await self._publish_task(task_id, task)
+
+        # Count the task as in flight before the loop ever schedules it,
+        # so a burst of submissions arriving together cannot all pass the
+        # saturation check; _run_task decrements in its finally.
+        self._inflight += 1
+
+        # Start task in background, retaining a reference for shutdown drain
+        bg_task = asyncio.create_task(
             self._run_task(
                 task_id=task_id,
                 prompt=prompt,
@@ -82,6 +240,8 @@ class TaskManager:
                 max_points=max_points,
             )
         )
+        self._bg_tasks.add(bg_task)
+        bg_task.add_done_callback(self._bg_tasks.discard)
 
         return task_id
 
@@ -97,107 +257,227 @@ class TaskManager:
         max_points: Optional[int] = None,
     ):
         """Run a generation task."""
-        import traceback
-        
+        task = self.tasks[task_id]
         try:
-            async with self._lock:
-                self.tasks[task_id]["status"] = "processing"
-                self.tasks[task_id]["progress"] = 0.05
-                self.tasks[task_id]["message"] = "Starting generation..."
-
-            # Step 1: VLM enhancement (if enabled)
-            if use_vlm and pipeline.vlm and pipeline.vlm.is_available():
-                async with self._lock:
-                    self.tasks[task_id]["progress"] = 0.1
-                    self.tasks[task_id]["message"] = "Enhancing prompt with VLM..."
-                
-                # VLM is fast, do it in async
-                if image_path:
-                    vlm_response = pipeline.vlm.enhance_prompt(prompt, image_path=image_path)
-                else:
-                    vlm_response = pipeline.vlm.enhance_prompt(prompt)
-                enhanced_prompt = vlm_response.text
-            else:
-                enhanced_prompt = prompt
-
-            async with self._lock:
-                self.tasks[task_id]["progress"] = 0.2
-                self.tasks[task_id]["message"] = f"Generating 3D mesh... (this may take 2-5 minutes)"
-
-            # Step 2: 3D generation (this is the slow part)
-            # Run generation in thread pool (since it's CPU/GPU bound)
-            loop = asyncio.get_event_loop()
-            
-            # Create a wrapper that updates progress
-            def generate_with_progress():
+            async with self._admit:
+                await self._execute_task(
+                    task_id=task_id,
+                    task=task,
+                    prompt=prompt,
+                    pipeline=pipeline,
+                    image_path=image_path,
+                    use_vlm=use_vlm,
+                    config=config,
+                    format=format,
+                    max_points=max_points,
+                )
+        except Exception as e:
+            # Log full error for debugging
+            print(f"Task {task_id} failed:", file=sys.stderr, flush=True)
+            traceback.print_exc(file=sys.stderr)
+
+            task.error = str(e)
+            task.message = f"Generation failed: {str(e)}"
+            task.status = "failed"
+            await self._publish_task(task_id, task)
+        finally:
+            self._inflight -= 1
+            # The uploaded reference image is a throwaway temp file; remove
+            # it once the task is done so /tmp doesn't fill under sustained
+            # traffic.
+            if image_path:
                 try:
-                    # Generate mesh (this is slow - can take 2-5 minutes on CPU)
-                    result = pipeline.generator.generate(enhanced_prompt, config)
-                    return result
-                except Exception as e:
-                    # Log full traceback for debugging
-                    import sys
-                    import traceback
-                    error_trace = traceback.format_exc()
-                    print(f"Generation error: {error_trace}", file=sys.stderr)
-                    raise
-
-            result = await loop.run_in_executor(None, generate_with_progress)
-
-            async with self._lock:
-                self.tasks[task_id]["progress"] = 0.8
-                self.tasks[task_id]["message"] = "Exporting mesh..."
-
-            # Step 3: Export
-            exporter = self._get_exporter(format, max_points=max_points, seed=config.seed if config else None)
-            output_path = self.output_dir / f"{task_id}.{format}"
-            await loop.run_in_executor(
-                None,
-                lambda: exporter.export(result, str(output_path)),
+                    os.unlink(image_path)
+                except OSError:
+                    pass
+
+    async def _execute_task(
+        self,
+        task_id: str,
+        task: TaskState,
+        prompt: str,
+        pipeline: ThreeDPipeline,
+        image_path: Optional[str] = None,
+        use_vlm: bool = True,
+        config: Optional[GenerationConfig] = None,
+        format: str = "obj",
+        max_points: Optional[int] = None,
+    ):
+        """Execute the generation steps for an admitted task."""
+        task.status = "processing"
+        task.progress = 0.05
+        task.message = "Starting generation..."
+        await self._publish_task(task_id, task)
+
+        # Step 1: VLM enhancement (if enabled)
+        if use_vlm and pipeline.vlm and pipeline.vlm.is_available():
+            task.progress = 0.1
+            task.message = "Enhancing prompt with VLM..."
+
+            # Await the VLM call so the HTTP round-trip doesn't block
+            # the event loop (and other tasks' progress polls).
+            vlm_response = await pipeline.vlm.enhance_prompt_async(
+                prompt, image_path=image_path
             )
+            enhanced_prompt = vlm_response.text
+        else:
+            enhanced_prompt = prompt
 
-            async with self._lock:
-                self.tasks[task_id]["status"] = "completed"
-                self.tasks[task_id]["progress"] = 1.0
-                self.tasks[task_id]["message"] = "Generation completed"
-                self.tasks[task_id]["result_path"] = str(output_path)
+        # XYZ output keeps only the points; let file-parsing backends skip
+        # faces and normals.
+        if format == "xyz":
+            config = replace(config or GenerationConfig(), vertices_only=True)
 
-        except Exception as e:
-            # Log full error for debugging
-            error_trace = traceback.format_exc()
-            print(f"Task {task_id} failed: {error_trace}", flush=True)
-            
-            async with self._lock:
-                self.tasks[task_id]["status"] = "failed"
-                self.tasks[task_id]["error"] = str(e)
-                self.tasks[task_id]["message"] = f"Generation failed: {str(e)}"
+        # Reuse a cached render when the exact same request was served before
+        cache_key = _cache_key(
+            enhanced_prompt, config, format, max_points,
+            type(pipeline.generator).__name__,
+        )
+        cache_path = self.cache_dir / f"{cache_key}.{format}"
+        output_path = self.output_dir / f"{task_id}.{format}"
+        if cache_path.exists():
+            await asyncio.to_thread(shutil.copyfile, cache_path, output_path)
+            task.result_path = str(output_path)
+            task.progress = 1.0
+            task.message = "Generation completed (cached)"
+            task.status = "completed"
+            await self._publish_task(task_id, task)
+            return
+
+        task.progress = 0.2
+        task.message = "Generating 3D mesh... (this may take 2-5 minutes)"
+        await self._publish_task(task_id, task)
+
+        # Step 2: 3D generation (this is the slow part)
+        if type(pipeline.generator).__name__ == "ShapEGenerator":
+            # Local torch inference: run in the process pool so concurrent
+            # generations don't serialize on the GIL.
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._gen_executor,
+                _generate_in_subprocess,
+                enhanced_prompt,
+                config,
+                pipeline.generator.device,
+            )
+        else:
+            # API-backed generators are network-bound; a thread is fine.
+            # Failures propagate to the outer handler, which logs them.
+            result = await asyncio.to_thread(
+                pipeline.generator.generate, enhanced_prompt, config
+            )
+
+        task.progress = 0.8
+        task.message = "Exporting mesh..."
+        await self._publish_task(task_id, task)
+
+        # Step 3: Export to the cache, then copy into place
+        exporter = self._get_exporter(format, max_points=max_points, seed=config.seed if config else None)
+
+        def export_and_cache():
+            # Export to a task-private temp file and publish it atomically:
+            # two tasks with the same cache key would otherwise interleave
+            # writes into the shared file. With os.replace, readers (the
+            # cached-hit copyfile above included) always see either the old
+            # or the new complete render, never a partial one.
+            tmp_path = cache_path.with_name(f".{cache_path.name}.{task_id}.tmp")
+            try:
+                exporter.export(result, str(tmp_path))
+                os.replace(tmp_path, cache_path)
+            finally:
+                if tmp_path.exists():
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+            shutil.copyfile(cache_path, output_path)
+
+        await asyncio.to_thread(export_and_cache)
+
+        task.result_path = str(output_path)
+        task.progress = 1.0
+        task.message = "Generation completed"
+        task.status = "completed"
+        await self._publish_task(task_id, task)
+
+    def get_version(self, task_id: str) -> int:
+        """Snapshot the update counter for a task (0 if not local)."""
+        task = self.tasks.get(task_id)
+        return task.version if task else 0
+
+    async def wait_for_update(
+        self, task_id: str, last_version: Optional[int] = None, timeout: float = 30.0
+    ) -> None:
+        """Wait for the next state change of a task (or until timeout).
+
+        Pass the version snapshotted via :meth:`get_version` before the
+        caller last suspended: if a publish landed in between (e.g. while
+        an SSE generator was blocked on client backpressure), this
+        returns immediately instead of sleeping a full timeout on a
+        pulse that already fired.
+        """
+        task = self.tasks.get(task_id)
+        if task is None:
+            # Task owned by another worker: there is no local Event to
+            # await, so pace the caller instead of letting its SSE loop
+            # spin flat-out against Redis.
+            await asyncio.sleep(min(1.0, timeout))
+            return
+        if last_version is not None and task.version != last_version:
+            return
+        try:
+            await asyncio.wait_for(task.updated.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def aclose(self, drain_timeout: float = 300.0) -> None:
+        """Drain in-flight tasks and release pools on shutdown.
+
+        Stops admitting new tasks, waits up to ``drain_timeout`` seconds for
+        running generations to finish (a cancelled generation wastes minutes
+        of prior compute), then shuts down the worker pool.
+        """
+        self._closing = True
+        if self._bg_tasks:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*self._bg_tasks, return_exceptions=True),
+                    timeout=drain_timeout,
+                )
+            except asyncio.TimeoutError:
+                print("TaskManager shutdown: drain timed out, cancelling remaining tasks", flush=True)
+        self._gen_executor.shutdown(wait=True, cancel_futures=True)
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
 
     async def get_task_status(self, task_id: str) -> Optional[TaskStatusResponse]:
         """Get status of a task."""
-        async with self._lock:
-            task = self.tasks.get(task_id)
-            if not task:
-                return None
+        task = self.tasks.get(task_id)
+        if not task:
+            # Task may have been created by another worker process
+            task = await self._fetch_task(task_id)
+        if not task:
+            return None
 
-            result_url = None
-            if task["status"] == "completed" and task["result_path"]:
-                filename = Path(task["result_path"]).name
-                result_url = f"/api/files/{filename}"
+        result_url = None
+        if task.status == "completed" and task.result_path:
+            filename = Path(task.result_path).name
+            result_url = f"/api/files/{filename}"
 
-            return TaskStatusResponse(
-                task_id=task_id,
-                status=task["status"],
-                progress=task["progress"],
-                message=task["message"],
-                result_url=result_url,
-                error=task.get("error"),
-            )
+        return TaskStatusResponse(
+            task_id=task_id,
+            status=task.status,
+            progress=task.progress,
+            message=task.message,
+            result_url=result_url,
+            error=task.error,
+        )
 
     def get_result_path(self, task_id: str) -> Optional[Path]:
         """Get the result file path for a completed task."""
         task = self.tasks.get(task_id)
-        if task and task["status"] == "completed" and task["result_path"]:
-            return Path(task["result_path"])
+        if task and task.status == "completed" and task.result_path:
+            return Path(task.result_path)
         return None
 
 
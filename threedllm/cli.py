@@ -16,17 +16,22 @@ from threedllm.vlm.openai import OpenAIProvider
 from threedllm.visualize import print_mesh_info, visualize_mesh
 
 
+EXPORTER_CLASSES = {
+    "xyz": XYZExporter,
+    "obj": OBJExporter,
+    "ply": PLYExporter,
+    "stl": STLExporter,
+}
+
+
 def get_exporter(format_name: str, max_points: int = None, seed: int = None):
     """Get exporter by format name."""
-    exporters = {
-        "xyz": XYZExporter(max_points=max_points, seed=seed),
-        "obj": OBJExporter(),
-        "ply": PLYExporter(),
-        "stl": STLExporter(),
-    }
-    if format_name not in exporters:
-        raise ValueError(f"Unknown format: {format_name}. Choose from: {list(exporters.keys())}")
-    return exporters[format_name]
+    cls = EXPORTER_CLASSES.get(format_name)
+    if cls is None:
+        raise ValueError(f"Unknown format: {format_name}. Choose from: {list(EXPORTER_CLASSES.keys())}")
+    if cls is XYZExporter:
+        return cls(max_points=max_points, seed=seed)
+    return cls()
 
 
 def main():
@@ -201,7 +206,7 @@ Examples:
             config=config,
         )
         print(f"\n✓ Generated {len(result.vertices)} vertices")
-        if result.faces:
+        if result.faces is not None:
             print(f"✓ Generated {len(result.faces)} faces")
         print(f"✓ Saved to: {output_path}")
 
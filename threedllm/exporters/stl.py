@@ -36,10 +36,10 @@ class STLExporter(Exporter3D):
 
     def export(self, result: MeshResult, path: str) -> None:
         """Export mesh as binary STL file."""
-        if not result.faces:
+        if result.faces is None:
             raise ValueError("STL export requires faces. Use OBJ or PLY for point clouds.")
 
-        with open(path, "wb") as f:
+        with open(path, "wb", buffering=1 << 20) as f:
             # Write 80-byte header
             header = b"STL file generated by ThreeDLLM"
             if result.prompt:
@@ -1,8 +1,9 @@
 """XYZ point cloud exporter."""
 
-import random
 from typing import List, Optional
 
+import numpy as np
+
 from threedllm.exporters.base import Exporter3D
 from threedllm.generators.base import MeshResult, Point
 
@@ -25,12 +26,15 @@ class XYZExporter(Exporter3D):
         """Get the file extension."""
         return ".xyz"
 
-    def _sample_points(self, vertices: List[Point], count: int) -> List[Point]:
-        """Sample points from vertices."""
-        if count <= 0 or count >= len(vertices):
-            return vertices
-        rng = random.Random(self.seed)
-        return rng.sample(vertices, count)
+    def _sample_points(self, vertices: List[Point], count: int) -> np.ndarray:
+        """Sample points from vertices without replacement."""
+        arr = np.asarray(vertices, dtype=np.float32)
+        if count <= 0 or count >= len(arr):
+            return arr
+        # C-level sampling of indices instead of random.sample shuffling
+        # a Python list of tuples.
+        idx = np.random.default_rng(self.seed).choice(len(arr), size=count, replace=False)
+        return arr[idx]
 
     def export(self, result: MeshResult, path: str) -> None:
         """Export mesh as XYZ point cloud."""
@@ -38,8 +42,9 @@ class XYZExporter(Exporter3D):
         if self.max_points and len(points) > self.max_points:
             points = self._sample_points(points, self.max_points)
 
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(f"{len(points)}\n")
-            f.write(f"prompt={result.prompt}\n")
-            for x, y, z in points:
-                f.write(f"{x:.6f} {y:.6f} {z:.6f}\n")
+        # One C-level formatter call via savetxt instead of a Python
+        # format/write per point.
+        arr = np.asarray(points, dtype=np.float32)
+        with open(path, "wb", buffering=1 << 20) as f:
+            f.write(f"{len(arr)}\nprompt={result.prompt}\n".encode("utf-8"))
+            np.savetxt(f, arr, fmt="%.6f", delimiter=" ")
@@ -1,31 +1,238 @@
 """Base class for API-based 3D generators."""
 
+import asyncio
+import functools
+import gzip
+import io
+import json
 import os
+import random
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional
 
-import requests
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from threedllm.generators.base import GenerationConfig, Generator3D, MeshResult
 
 
+def dumps_json(payload) -> bytes:
+    """Serialize a request payload, using orjson's C encoder when present."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def loads_json(data: bytes):
+    """Deserialize a response body, using orjson when present.
+
+    Matters most for responses carrying vertex/face arrays, which orjson
+    decodes several times faster than the stdlib parser.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def build_http_adapter():
+    """Build the HTTPAdapter shared by API-backed generators.
+
+    A larger connection pool avoids throttling concurrent submits on the
+    default pool of 10, and transient 429/5xx responses are retried with
+    backoff instead of bubbling up.
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    return HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "POST"],
+        ),
+    )
+
+
+def _is_httpx_client(client) -> bool:
+    """Whether the client is an httpx.Client rather than a requests.Session.
+
+    Duck-typing on the `stream` attribute doesn't work here:
+    requests.Session sets `self.stream = False` in __init__, so every
+    session "has" stream too — it's just not callable.
+    """
+    try:
+        import httpx
+    except ImportError:
+        return False
+    return isinstance(client, httpx.Client)
+
+
+def _presized_buffer(headers) -> io.BytesIO:
+    """BytesIO pre-sized from Content-Length when the server provides it."""
+    length = headers.get("Content-Length", "")
+    if length.isdigit():
+        buf = io.BytesIO(bytes(int(length)))
+        buf.seek(0)
+        return buf
+    return io.BytesIO()
+
+
+def stream_download(session, url: str, timeout: float = 60) -> bytes:
+    """Download a file in 1 MiB chunks instead of one .content slurp.
+
+    Streaming avoids holding the body twice (urllib3 buffer plus the final
+    bytes object) while the transfer is in flight. Works with both
+    requests.Session and httpx.Client.
+    """
+    if _is_httpx_client(session):
+        with session.stream("GET", url, timeout=timeout) as response:
+            response.raise_for_status()
+            buf = _presized_buffer(response.headers)
+            for chunk in response.iter_bytes(1 << 20):
+                buf.write(chunk)
+            buf.truncate(buf.tell())
+        return buf.getvalue()
+
+    with session.get(url, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        buf = _presized_buffer(response.headers)
+        # iter_content (unlike response.raw) applies content decoding
+        for chunk in response.iter_content(1 << 20):
+            buf.write(chunk)
+        buf.truncate(buf.tell())
+    return buf.getvalue()
+
+
+def create_http_session():
+    """Create the HTTP client used by API generators.
+
+    Prefers an HTTP/2 httpx.Client when httpx (with the h2 extra) is
+    installed, so the submit/poll/download cycle multiplexes over a single
+    TLS connection; falls back to a requests.Session with a tuned adapter.
+    """
+    try:
+        import h2  # noqa: F401
+        import httpx
+
+        return httpx.Client(
+            http2=True,
+            timeout=httpx.Timeout(120),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        )
+    except ImportError:
+        import requests
+
+        session = requests.Session()
+        adapter = build_http_adapter()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+
+#: Statuses worth retrying: rate limits and transient server errors.
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def post_with_retries(client, url: str, body: bytes, headers: dict,
+                      max_attempts: int = 5, timeout: float = 60,
+                      compress: Optional[bool] = None):
+    """POST a JSON body with backoff on 429/5xx and opt-in compression.
+
+    Retryable statuses sleep min(60, 2**attempt) seconds plus jitter (or
+    the server's Retry-After) before trying again; the last response is
+    returned either way. Works with both requests.Session and
+    httpx.Client.
+
+    With ``compress`` (default: the THREEDLLM_GZIP_REQUESTS env var),
+    bodies over 1 KiB are gzip-compressed — base64 image payloads shrink
+    3-5x since base64 is low-entropy. Off by default because most public
+    APIs, api.openai.com included, reject gzip request bodies.
+    """
+    headers = dict(headers)
+    headers.setdefault("Accept-Encoding", "gzip")
+    if compress is None:
+        compress = os.environ.get("THREEDLLM_GZIP_REQUESTS", "").lower() in ("1", "true", "yes")
+    if compress and len(body) > 1024:
+        body = gzip.compress(body, compresslevel=1)
+        headers["Content-Encoding"] = "gzip"
+    kwargs = {"content": body} if _is_httpx_client(client) else {"data": body}
+
+    response = None
+    for attempt in range(max_attempts):
+        response = client.post(url, headers=headers, timeout=timeout, **kwargs)
+        if response.status_code not in RETRY_STATUS_CODES:
+            break
+        if attempt == max_attempts - 1:
+            break
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = float(retry_after)
+        else:
+            delay = min(60, 2 ** attempt) + random.random()
+        time.sleep(delay)
+    return response
+
+
+#: Executor shared by every APIGenerator3D instance for generate_async.
+#: One module-level pool keeps concurrent generations on a bounded set
+#: of threads (and their sessions' keep-alive connections) instead of
+#: each instance spinning up its own workers. Created lazily so merely
+#: importing the module spawns no threads.
+_shared_pool: Optional[ThreadPoolExecutor] = None
+_shared_pool_lock = threading.Lock()
+
+
+def _get_shared_pool() -> ThreadPoolExecutor:
+    global _shared_pool
+    if _shared_pool is None:
+        with _shared_pool_lock:
+            if _shared_pool is None:
+                _shared_pool = ThreadPoolExecutor(
+                    max_workers=8, thread_name_prefix="threedllm-api"
+                )
+    return _shared_pool
+
+
 class APIGenerator3D(Generator3D, ABC):
     """Base class for API-based 3D generators."""
 
-    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        poll_interval: float = 0.5,
+        max_wait: float = 300.0,
+    ):
         """
         Initialize API generator.
 
         Args:
             api_key: API key for the service (can also be set via environment variable).
             base_url: Base URL for the API (optional, uses default if not provided).
+            poll_interval: Initial status-poll interval in seconds; grows
+                exponentially up to a 30s ceiling.
+            max_wait: Maximum total time to wait for a generation, in seconds.
         """
         self.api_key = api_key or os.environ.get(self._get_api_key_env_name())
         self.base_url = base_url or self._get_default_base_url()
-        self._session = requests.Session()
+        self.poll_interval = poll_interval
+        self.max_wait = max_wait
+        self._session = create_http_session()
         if self.api_key:
             self._session.headers.update(self._get_auth_headers())
+        # Credentials are immutable after init; validate once instead of
+        # re-checking on every generate() call.
+        self._available = self.api_key is not None and bool(self.api_key.strip())
+        # Last seen ETag per task, for conditional status GETs.
+        self._status_etags: dict = {}
 
     @abstractmethod
     def _get_api_key_env_name(self) -> str:
@@ -62,16 +269,41 @@ class APIGenerator3D(Generator3D, ABC):
         pass
 
     @abstractmethod
-    def _check_status(self, task_id: str) -> dict:
+    def _check_status(self, task_id: str, wait_seconds: float = 0) -> dict:
         """
         Check the status of a generation task.
 
+        Args:
+            task_id: Task/job ID returned by _submit_generation.
+            wait_seconds: Hint for long-poll support: backends whose API can
+                hold the connection until completion (or this many seconds)
+                should pass it along; others may ignore it.
+
         Returns:
             Dict with 'status' ('pending', 'processing', 'completed', 'failed')
             and optionally 'result_url' or 'error'.
         """
         pass
 
+    def _conditional_get(self, url: str, task_id: str, params=None, timeout: float = 10):
+        """GET a status URL with If-None-Match from the task's last ETag.
+
+        Returns None on a 304 Not Modified — the status hasn't changed,
+        so the caller can skip re-parsing the JSON body entirely.
+        """
+        headers = None
+        etag = self._status_etags.get(task_id)
+        if etag:
+            headers = {"If-None-Match": etag}
+        response = self._session.get(url, params=params, headers=headers, timeout=timeout)
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+        etag = response.headers.get("ETag")
+        if etag:
+            self._status_etags[task_id] = etag
+        return response
+
     @abstractmethod
     def _download_result(self, result_url: str) -> bytes:
         """Download the generated 3D model file."""
@@ -110,35 +342,173 @@ class APIGenerator3D(Generator3D, ABC):
         # Submit generation request
         task_id = self._submit_generation(prompt, config)
 
-        # Poll for completion
-        max_wait = 300  # 5 minutes max
-        poll_interval = 5  # Check every 5 seconds
-        start_time = time.time()
+        status_info = self._wait_for_completion(task_id)
+
+        result_url = status_info.get("result_url")
+        if not result_url:
+            raise RuntimeError("Generation completed but no result URL provided")
 
-        while time.time() - start_time < max_wait:
-            status_info = self._check_status(task_id)
+        file_data = self._download_result(result_url)
+        return self._parse_mesh(file_data, status_info.get("format", "obj"))
 
-            if status_info["status"] == "completed":
-                # Download result
-                result_url = status_info.get("result_url")
-                if not result_url:
-                    raise RuntimeError("Generation completed but no result URL provided")
+    def _wait_for_completion(self, task_id: str) -> dict:
+        """Poll a task until it completes; returns the final status dict.
 
-                file_data = self._download_result(result_url)
-                format = status_info.get("format", "obj")
+        Uses exponential backoff with jitter: fast jobs finish within a
+        sub-second poll instead of eating a fixed 5s sleep, and slow jobs
+        issue far fewer status requests.
+        """
+        interval = self.poll_interval
+        start_time = time.time()
 
-                # Parse mesh
-                return self._parse_mesh(file_data, format)
+        try:
+            while time.time() - start_time < self.max_wait:
+                remaining = self.max_wait - (time.time() - start_time)
+                status_info = self._check_status(task_id, wait_seconds=min(30.0, remaining))
 
-            elif status_info["status"] == "failed":
-                error = status_info.get("error", "Unknown error")
-                raise RuntimeError(f"Generation failed: {error}")
+                if status_info["status"] == "completed":
+                    return status_info
+                if status_info["status"] == "failed":
+                    error = status_info.get("error", "Unknown error")
+                    raise RuntimeError(f"Generation failed: {error}")
 
-            # Still processing, wait and retry
-            time.sleep(poll_interval)
+                # Still processing, wait and retry with backoff + jitter
+                time.sleep(interval * (0.8 + 0.4 * random.random()))
+                interval = min(interval * 1.5, 30.0)
+        finally:
+            self._status_etags.pop(task_id, None)
 
         raise RuntimeError("Generation timed out")
 
+    def _submit_batch(
+        self, prompts: List[str], config: Optional[GenerationConfig] = None
+    ) -> List[str]:
+        """Submit several prompts and return their task IDs.
+
+        Backends whose API accepts array inputs should override this with
+        a single submission; the default falls back to one submit per
+        prompt (still amortizing the connection and poll loop).
+        """
+        return [self._submit_generation(prompt, config) for prompt in prompts]
+
+    def _check_status_many(self, task_ids: List[str]) -> List[dict]:
+        """Check status for several tasks.
+
+        Backends with a bulk status endpoint should override this; the
+        default issues one request per task over the pooled connection.
+        """
+        return [self._check_status(task_id) for task_id in task_ids]
+
+    def generate_batch(
+        self, prompts: List[str], config: Optional[GenerationConfig] = None
+    ) -> List[MeshResult]:
+        """
+        Generate meshes for several prompts in one submit/poll cycle.
+
+        All prompts are submitted up front, then a single poll loop
+        sweeps the outstanding tasks, so N prompts cost one round of
+        connection setup and one backoff schedule instead of N serial
+        submit-poll-download cycles.
+
+        Args:
+            prompts: Text descriptions of the 3D objects.
+            config: Optional generation configuration shared by the batch.
+
+        Returns:
+            MeshResults in the same order as the prompts.
+        """
+        if not self.is_available():
+            raise RuntimeError(f"{self.__class__.__name__} is not available. Check API key.")
+        if not prompts:
+            return []
+
+        task_ids = self._submit_batch(prompts, config)
+        futures: List[Optional[Future]] = [None] * len(prompts)
+        pending = dict(enumerate(task_ids))
+
+        interval = self.poll_interval
+        start_time = time.time()
+
+        while pending and time.time() - start_time < self.max_wait:
+            indices = list(pending)
+            statuses = self._check_status_many([pending[i] for i in indices])
+
+            for index, status_info in zip(indices, statuses):
+                if status_info["status"] == "completed":
+                    result_url = status_info.get("result_url")
+                    if not result_url:
+                        raise RuntimeError("Generation completed but no result URL provided")
+                    # Download+parse on the shared pool so it overlaps
+                    # with polling the still-pending tasks.
+                    futures[index] = _get_shared_pool().submit(
+                        self._download_and_parse,
+                        result_url,
+                        status_info.get("format", "obj"),
+                        prompts[index],
+                    )
+                    del pending[index]
+                elif status_info["status"] == "failed":
+                    error = status_info.get("error", "Unknown error")
+                    raise RuntimeError(f"Generation failed: {error}")
+
+            if pending:
+                time.sleep(interval * (0.8 + 0.4 * random.random()))
+                interval = min(interval * 1.5, 30.0)
+
+        if pending:
+            raise RuntimeError("Generation timed out")
+        return [future.result() for future in futures]
+
+    def _download_and_parse(self, result_url: str, format: str, prompt: str) -> MeshResult:
+        """Download and parse one completed result."""
+        file_data = self._download_result(result_url)
+        result = self._parse_mesh(file_data, format)
+        result.prompt = prompt
+        return result
+
+    def generate_async(
+        self, prompt: str, config: Optional[GenerationConfig] = None
+    ) -> "Future[MeshResult]":
+        """Run generate() on the shared pool and return a Future.
+
+        Generators constructed side by side in a batch pipeline all
+        submit here, so their submit/poll cycles overlap on at most
+        eight threads; collect results with
+        concurrent.futures.as_completed.
+        """
+        return _get_shared_pool().submit(self.generate, prompt, config)
+
+    async def generate_batch_async(
+        self, prompts: List[str], config: Optional[GenerationConfig] = None
+    ) -> List[MeshResult]:
+        """
+        Generate meshes for several prompts concurrently from async code.
+
+        Fans the prompts out over the shared worker pool with
+        asyncio.gather, so total wall time approaches the slowest job
+        rather than the sum — each worker's poll loop long-polls on the
+        pooled keep-alive connection while the event loop stays free.
+
+        Args:
+            prompts: Text descriptions of the 3D objects.
+            config: Optional generation configuration shared by the batch.
+
+        Returns:
+            MeshResults in the same order as the prompts.
+        """
+        loop = asyncio.get_running_loop()
+        pool = _get_shared_pool()
+        return list(
+            await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        pool, functools.partial(self.generate, prompt, config)
+                    )
+                    for prompt in prompts
+                )
+            )
+        )
+
     def is_available(self) -> bool:
         """Check if the API generator is available (has API key)."""
-        return self.api_key is not None and len(self.api_key.strip()) > 0
+        return self._available
@@ -4,10 +4,12 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
+import numpy as np
+
 Point = Tuple[float, float, float]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GenerationConfig:
     """Configuration for 3D generation."""
 
@@ -19,6 +21,15 @@ class GenerationConfig:
     """Random seed for reproducibility."""
     batch_size: int = 1
     """Batch size for generation."""
+    precision: str = "bf16"
+    """Compute precision for local GPU backends: "fp32", "fp16" or "bf16".
+    bf16 matches fp16 throughput on Ampere+ with a wider dynamic range
+    (no overflow at high sigma_max); pre-Ampere GPUs emulate bf16, so
+    backends drop to fp16 there. Ignored on CPU and by API backends."""
+    vertices_only: bool = False
+    """Skip faces and normals when parsing generated meshes. Set for
+    point-cloud (XYZ) output where they would be discarded anyway; only
+    honored by backends that parse mesh files."""
     
     @classmethod
     def quality_preset(cls, preset: str = "balanced") -> "GenerationConfig":
@@ -40,19 +51,43 @@ class GenerationConfig:
         return cls(**presets[preset])
 
 
-@dataclass
+@dataclass(slots=True)
 class MeshResult:
-    """Result from 3D generation."""
-
-    vertices: List[Point]
-    """List of vertex coordinates (x, y, z)."""
-    faces: Optional[List[Tuple[int, int, int]]] = None
-    """List of face indices (triangles)."""
-    normals: Optional[List[Point]] = None
-    """Vertex normals (if available)."""
+    """Result from 3D generation.
+
+    Geometry is stored as NumPy arrays (struct-of-arrays) rather than
+    lists of tuples, so exporters and samplers can operate on whole
+    columns without boxing three floats per point. Constructors may pass
+    plain lists of tuples; they are coerced on init.
+    """
+
+    vertices: np.ndarray
+    """Vertex coordinates, float32 array of shape (N, 3)."""
+    faces: Optional[np.ndarray] = None
+    """Triangle vertex indices, int32 array of shape (M, 3)."""
+    normals: Optional[np.ndarray] = None
+    """Vertex normals, float32 array of shape (N, 3) (if available)."""
     prompt: str = ""
     """The prompt used for generation."""
 
+    def __post_init__(self):
+        self.vertices = np.asarray(self.vertices, dtype=np.float32).reshape(-1, 3)
+        if self.faces is not None:
+            if len(self.faces) > 0:
+                self.faces = np.asarray(self.faces, dtype=np.int32).reshape(-1, 3)
+            else:
+                self.faces = None
+        if self.normals is not None:
+            if len(self.normals) > 0:
+                self.normals = np.asarray(self.normals, dtype=np.float32).reshape(-1, 3)
+            else:
+                self.normals = None
+
+    @property
+    def vertex_tuples(self) -> List[Point]:
+        """Vertices as a list of (x, y, z) tuples (compatibility view)."""
+        return [tuple(v) for v in self.vertices.tolist()]
+
 
 class Generator3D(ABC):
     """Abstract base class for 3D generation backends."""
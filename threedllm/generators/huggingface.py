@@ -6,14 +6,105 @@ Supports three deployment modes:
 3. Local model (self-hosted)
 """
 
+import functools
+import logging
 import io
+import mmap
 import os
+import tempfile
+from concurrent.futures import Future
 from typing import Optional
 
-import trimesh
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 from threedllm.generators.base import GenerationConfig, Generator3D, MeshResult
 
+logger = logging.getLogger(__name__)
+
+#: Top-level response keys streamed into compact numeric buffers instead
+#: of Python lists when decoding large JSON bodies.
+_GEOMETRY_KEYS = ("vertices", "faces", "normals")
+
+
+def _decode_json_stream(stream) -> dict:
+    """Decode a JSON response, streaming geometry arrays off the wire.
+
+    Numbers under top-level ``vertices``/``faces``/``normals`` keys go
+    straight into array('f'/'q') buffers and come out as ndarrays,
+    skipping the list-of-PyFloat intermediate (~28 bytes per float) that
+    response.json() would build. Everything else is assembled normally.
+    """
+    from array import array
+
+    import numpy as np
+
+    buffers = {
+        "vertices": array("f"),
+        "faces": array("q"),
+        "normals": array("f"),
+    }
+    builder = ijson.ObjectBuilder()
+    for prefix, event, value in ijson.parse(stream):
+        head, dot, _ = prefix.partition(".")
+        if dot and head in buffers:
+            if event == "number":
+                buffers[head].append(float(value))
+            continue
+        builder.event(event, value)
+
+    response = builder.value
+    for key, buf in buffers.items():
+        if len(buf) > 0:
+            dtype = np.int64 if key == "faces" else np.float32
+            response[key] = np.frombuffer(buf, dtype=dtype).reshape(-1, 3)
+    return response
+
+
+#: Static GenerationConfig-field -> HF-parameter mapping, so payload
+#: building is a dict comprehension instead of per-call hasattr chains.
+_PARAM_MAP = {
+    "karras_steps": "num_inference_steps",
+    "guidance_scale": "guidance_scale",
+    "seed": "seed",
+}
+
+
+def _build_parameters(config: Optional[GenerationConfig]) -> dict:
+    """Map a GenerationConfig onto the model's parameter names."""
+    if config is None:
+        return {}
+    return {
+        param: value
+        for field, param in _PARAM_MAP.items()
+        if (value := getattr(config, field, None)) is not None
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _has_local_deps() -> bool:
+    """Whether torch + transformers are importable (cached; ~100ms)."""
+    try:
+        import torch  # noqa: F401
+        from transformers import AutoModel  # noqa: F401
+
+        return True
+    except ImportError:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _has_cuda() -> bool:
+    """Whether CUDA is available (cached; importing torch is expensive)."""
+    try:
+        import torch
+
+        return torch.cuda.is_available()
+    except ImportError:
+        return False
+
 
 class HuggingFaceGenerator(Generator3D):
     """
@@ -47,7 +138,7 @@ class HuggingFaceGenerator(Generator3D):
         self.endpoint_url = endpoint_url or os.environ.get("HF_ENDPOINT_URL")
         self.api_token = api_token or os.environ.get("HF_API_TOKEN")
         self.local_model_path = local_model_path or os.environ.get("HF_LOCAL_MODEL_PATH")
-        self.device = device or os.environ.get("HF_DEVICE", "cuda" if self._has_cuda() else "cpu")
+        self.device = device or os.environ.get("HF_DEVICE", "cuda" if _has_cuda() else "cpu")
         
         # Determine deployment mode
         if self.endpoint_url:
@@ -65,19 +156,26 @@ class HuggingFaceGenerator(Generator3D):
         # HTTP session for API/Endpoint calls
         self._session = None
 
-    def _has_cuda(self) -> bool:
-        """Check if CUDA is available."""
-        try:
-            import torch
-            return torch.cuda.is_available()
-        except ImportError:
-            return False
+        # Configuration is immutable after init, so availability is
+        # computed once rather than re-probed per generate() call.
+        if self.mode == "local":
+            self._available = _has_local_deps()
+        elif self.mode == "endpoint":
+            self._available = bool(self.endpoint_url and self.api_token)
+        else:  # inference_api
+            self._available = bool(self.model_id and self.api_token)
 
     def _get_session(self):
         """Get or create HTTP session for API calls."""
         if self._session is None:
             import requests
+
+            from threedllm.generators.api_base import build_http_adapter
+
             self._session = requests.Session()
+            adapter = build_http_adapter()
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
             if self.api_token:
                 self._session.headers.update({
                     "Authorization": f"Bearer {self.api_token}",
@@ -93,7 +191,7 @@ class HuggingFaceGenerator(Generator3D):
         if not self.local_model_path:
             raise RuntimeError("HF_LOCAL_MODEL_PATH not set for local model deployment")
         
-        print(f"[HuggingFace] Loading local model from: {self.local_model_path}", flush=True)
+        logger.info("Loading local model from: %s", self.local_model_path)
         
         try:
             # Try to load as a transformers model
@@ -110,7 +208,7 @@ class HuggingFaceGenerator(Generator3D):
                     device_map=self.device,
                 )
             except Exception as e:
-                print(f"[HuggingFace] AutoModel failed, trying alternative loading: {e}", flush=True)
+                logger.warning("AutoModel failed, trying alternative loading: %s", e)
                 # Fallback: try loading with specific model class
                 # You may need to customize this based on your specific model
                 import torch
@@ -120,7 +218,7 @@ class HuggingFaceGenerator(Generator3D):
                 raise RuntimeError(f"Model loading failed. You may need to customize the loading code for your model type: {e}")
             
             self._loaded = True
-            print(f"[HuggingFace] Local model loaded successfully", flush=True)
+            logger.info("Local model loaded successfully")
             
         except ImportError:
             raise RuntimeError(
@@ -132,19 +230,7 @@ class HuggingFaceGenerator(Generator3D):
 
     def is_available(self) -> bool:
         """Check if Hugging Face generator is available."""
-        if self.mode == "local":
-            try:
-                import torch
-                from transformers import AutoModel
-                return True
-            except ImportError:
-                return False
-        elif self.mode == "endpoint":
-            # Check if endpoint URL and token are set
-            return bool(self.endpoint_url and self.api_token)
-        else:  # inference_api
-            # Check if model ID and token are set
-            return bool(self.model_id and self.api_token)
+        return self._available
 
     def _call_inference_api(self, prompt: str, config: Optional[GenerationConfig] = None) -> dict:
         """Call Hugging Face Inference API."""
@@ -163,26 +249,17 @@ class HuggingFaceGenerator(Generator3D):
         # Adjust this based on your model's expected input format
         payload = {
             "inputs": prompt,
-            "parameters": {}
+            "parameters": _build_parameters(config),
         }
-        
-        if config:
-            # Map our config to model-specific parameters
-            # Adjust these based on your model's API
-            if hasattr(config, 'karras_steps'):
-                payload["parameters"]["num_inference_steps"] = config.karras_steps
-            if hasattr(config, 'guidance_scale'):
-                payload["parameters"]["guidance_scale"] = config.guidance_scale
-            if config.seed is not None:
-                payload["parameters"]["seed"] = config.seed
-        
-        print(f"[HuggingFace] Calling Inference API: {url}", flush=True)
-        print(f"[HuggingFace] Payload: {payload}", flush=True)
-        
-        response = session.post(url, json=payload, timeout=120)
-        response.raise_for_status()
-        
-        return response.json()
+
+        logger.debug("Calling Inference API: %s", url)
+        logger.debug("Payload: %s", payload)
+
+        from threedllm.generators.api_base import dumps_json
+
+        with session.post(url, data=dumps_json(payload), timeout=120, stream=True) as response:
+            response.raise_for_status()
+            return self._decode_response(response)
 
     def _call_endpoint(self, prompt: str, config: Optional[GenerationConfig] = None) -> dict:
         """Call Hugging Face Inference Endpoint."""
@@ -194,23 +271,42 @@ class HuggingFaceGenerator(Generator3D):
         # Prepare request payload
         payload = {
             "inputs": prompt,
-            "parameters": {}
+            "parameters": _build_parameters(config),
         }
-        
-        if config:
-            if hasattr(config, 'karras_steps'):
-                payload["parameters"]["num_inference_steps"] = config.karras_steps
-            if hasattr(config, 'guidance_scale'):
-                payload["parameters"]["guidance_scale"] = config.guidance_scale
-            if config.seed is not None:
-                payload["parameters"]["seed"] = config.seed
-        
-        print(f"[HuggingFace] Calling Endpoint: {self.endpoint_url}", flush=True)
-        
-        response = session.post(self.endpoint_url, json=payload, timeout=120)
-        response.raise_for_status()
-        
-        return response.json()
+
+        logger.debug("Calling Endpoint: %s", self.endpoint_url)
+
+        from threedllm.generators.api_base import dumps_json
+
+        with session.post(
+            self.endpoint_url, data=dumps_json(payload), timeout=120, stream=True
+        ) as response:
+            response.raise_for_status()
+            return self._decode_response(response)
+
+    #: JSON bodies above this size are stream-parsed (when ijson is
+    #: installed) instead of materialized as one Python object tree.
+    STREAM_JSON_THRESHOLD = 8 * 1024 * 1024
+
+    def _decode_response(self, response) -> dict:
+        """Decode a streamed API response body.
+
+        Large bodies (by Content-Length) are stream-parsed with ijson so
+        mesh-in-JSON vertex arrays land in numeric buffers; small or
+        unsized bodies take the ordinary orjson/json path.
+        """
+        from threedllm.generators.api_base import loads_json
+
+        length = response.headers.get("Content-Length", "")
+        if ijson is not None and length.isdigit() and int(length) > self.STREAM_JSON_THRESHOLD:
+            # response.raw yields the wire bytes; tell urllib3 to apply
+            # content decoding or a gzip-encoded body would feed
+            # compressed bytes to ijson. With an encoded body the
+            # Content-Length above is the compressed size — a lower
+            # bound on the JSON size, so the threshold stays valid.
+            response.raw.decode_content = True
+            return _decode_json_stream(response.raw)
+        return loads_json(response.content)
 
     def _generate_local(self, prompt: str, config: Optional[GenerationConfig] = None) -> dict:
         """Generate using local model."""
@@ -235,10 +331,12 @@ class HuggingFaceGenerator(Generator3D):
         
         return {"generated": result}
 
-    def _parse_response_to_mesh(self, response: dict) -> MeshResult:
+    def _parse_response_to_mesh(
+        self, response: dict, vertices_only: bool = False
+    ) -> MeshResult:
         """
         Parse API/Endpoint response to MeshResult.
-        
+
         This is model-specific. Adjust based on your model's output format.
         Common formats:
         - Direct mesh data (vertices, faces)
@@ -265,14 +363,16 @@ class HuggingFaceGenerator(Generator3D):
         if "file" in response or "mesh" in response:
             import base64
             file_data = base64.b64decode(response.get("file") or response.get("mesh"))
-            return self._parse_file_to_mesh(file_data)
+            return self._parse_file_to_mesh(file_data, vertices_only=vertices_only)
         
         # Option 3: Response contains URL to file
         if "url" in response or "download_url" in response:
+            from threedllm.generators.api_base import stream_download
+
             url = response.get("url") or response.get("download_url")
             session = self._get_session()
-            file_data = session.get(url, timeout=60).content
-            return self._parse_file_to_mesh(file_data)
+            file_data = stream_download(session, url, timeout=60)
+            return self._parse_file_to_mesh(file_data, vertices_only=vertices_only)
         
         # Option 4: Response contains raw bytes or file path
         if "data" in response:
@@ -281,7 +381,7 @@ class HuggingFaceGenerator(Generator3D):
                 # Assume base64
                 import base64
                 file_data = base64.b64decode(file_data)
-            return self._parse_file_to_mesh(file_data)
+            return self._parse_file_to_mesh(file_data, vertices_only=vertices_only)
         
         # If none of the above, try to parse as generic format
         # This might work if the response is already in a parseable format
@@ -291,27 +391,75 @@ class HuggingFaceGenerator(Generator3D):
             f"You may need to customize _parse_response_to_mesh() for your model."
         )
 
-    def _parse_file_to_mesh(self, file_data: bytes, format: str = "obj") -> MeshResult:
-        """Parse 3D file bytes to MeshResult using trimesh."""
+    #: Payloads above this size are spilled to disk and memory-mapped
+    #: rather than kept on the Python heap during parsing.
+    MMAP_THRESHOLD = 16 * 1024 * 1024
+
+    def _load_mesh_mmap(self, file_data: bytes, format: str):
+        """Parse a large mesh through a memory-mapped temp file.
+
+        trimesh then reads from the OS page cache, so peak RSS stays
+        roughly constant instead of ~2x the file size.
+        """
+        import trimesh
+
+        with tempfile.NamedTemporaryFile(delete=False) as tmp:
+            tmp.write(file_data)
+            path = tmp.name
+        del file_data
         try:
-            mesh = trimesh.load(io.BytesIO(file_data), file_type=format)
-            
-            vertices = [
-                (float(v[0]), float(v[1]), float(v[2])) for v in mesh.vertices
-            ]
-            
+            with open(path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return trimesh.load(
+                        mm,
+                        file_type=format,
+                        force="mesh",
+                        process=False,
+                        maintain_order=True,
+                        skip_materials=True,
+                    )
+        finally:
+            os.unlink(path)
+
+    def _parse_file_to_mesh(
+        self, file_data: bytes, format: str = "obj", vertices_only: bool = False
+    ) -> MeshResult:
+        """Parse 3D file bytes to MeshResult using trimesh.
+
+        With vertices_only=True the faces and normals are skipped, which
+        is the cheap path for point-cloud (XYZ) output where they would
+        be discarded anyway.
+        """
+        import trimesh
+
+        try:
+            if len(file_data) > self.MMAP_THRESHOLD:
+                mesh = self._load_mesh_mmap(file_data, format)
+            else:
+                mesh = trimesh.load(
+                    io.BytesIO(file_data),
+                    file_type=format,
+                    force="mesh",
+                    process=False,
+                    maintain_order=True,
+                    skip_materials=True,
+                )
+
+            if vertices_only:
+                return MeshResult(vertices=mesh.vertices, prompt="")
+
+            # trimesh already returns C-contiguous ndarrays; hand them to
+            # MeshResult directly instead of re-boxing every row in Python.
             faces = None
             if hasattr(mesh, "faces") and mesh.faces is not None:
-                faces = [tuple(map(int, face)) for face in mesh.faces]
-            
+                faces = mesh.faces
+
             normals = None
             if hasattr(mesh, "vertex_normals") and mesh.vertex_normals is not None:
-                normals = [
-                    (float(n[0]), float(n[1]), float(n[2])) for n in mesh.vertex_normals
-                ]
-            
+                normals = mesh.vertex_normals
+
             return MeshResult(
-                vertices=vertices,
+                vertices=mesh.vertices,
                 faces=faces,
                 normals=normals,
                 prompt="",
@@ -319,6 +467,20 @@ class HuggingFaceGenerator(Generator3D):
         except Exception as e:
             raise RuntimeError(f"Failed to parse mesh file: {e}")
 
+    def generate_async(
+        self, prompt: str, config: Optional[GenerationConfig] = None
+    ) -> "Future[MeshResult]":
+        """Submit a generation on a worker thread and return a Future.
+
+        Runs on the module-level pool shared with the API generators, so
+        a batch overlaps one result's download+parse (trimesh.load is
+        CPU-bound for large meshes) with the next request's network
+        wait; collect results with concurrent.futures.as_completed.
+        """
+        from threedllm.generators.api_base import _get_shared_pool
+
+        return _get_shared_pool().submit(self.generate, prompt, config)
+
     def generate(
         self, prompt: str, config: Optional[GenerationConfig] = None
     ) -> MeshResult:
@@ -333,8 +495,8 @@ class HuggingFaceGenerator(Generator3D):
         if config is None:
             config = GenerationConfig()
         
-        print(f"[HuggingFace] Generating 3D model (mode: {self.mode})...", flush=True)
-        print(f"[HuggingFace] Prompt: {prompt}", flush=True)
+        logger.info("Generating 3D model (mode: %s)", self.mode)
+        logger.debug("Prompt: %s", prompt)
         
         # Call appropriate method based on mode
         if self.mode == "inference_api":
@@ -345,7 +507,9 @@ class HuggingFaceGenerator(Generator3D):
             response = self._generate_local(prompt, config)
         
         # Parse response to mesh
-        mesh_result = self._parse_response_to_mesh(response)
+        mesh_result = self._parse_response_to_mesh(
+            response, vertices_only=config.vertices_only
+        )
         mesh_result.prompt = prompt
         
         return mesh_result
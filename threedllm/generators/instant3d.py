@@ -3,9 +3,7 @@
 import io
 from typing import Optional
 
-import trimesh
-
-from threedllm.generators.api_base import APIGenerator3D
+from threedllm.generators.api_base import APIGenerator3D, dumps_json, loads_json, stream_download
 from threedllm.generators.base import GenerationConfig, MeshResult
 
 
@@ -54,27 +52,34 @@ class Instant3DGenerator(APIGenerator3D):
 
         response = self._session.post(
             f"{self.base_url}/generate",
-            json=request_data,
+            data=dumps_json(request_data),
+            headers={"Content-Type": "application/json"},
             timeout=30,
         )
         response.raise_for_status()
 
-        result = response.json()
+        result = loads_json(response.content)
         task_id = result.get("job_id") or result.get("id") or result.get("task_id")
         if not task_id:
             raise RuntimeError("No task ID returned from API")
 
         return task_id
 
-    def _check_status(self, task_id: str) -> dict:
+    def _check_status(self, task_id: str, wait_seconds: float = 0) -> dict:
         """Check Instant3D generation status."""
-        response = self._session.get(
+        # Long-poll hint; servers without support ignore the parameter
+        wait = int(wait_seconds)
+        response = self._conditional_get(
             f"{self.base_url}/jobs/{task_id}",
-            timeout=10,
+            task_id,
+            params={"wait": wait} if wait > 0 else None,
+            timeout=wait + 10 if wait > 0 else 10,
         )
-        response.raise_for_status()
+        if response is None:
+            # 304: nothing changed since the last poll
+            return {"status": "processing"}
 
-        data = response.json()
+        data = loads_json(response.content)
         status = data.get("status", "pending").lower()
 
         result = {"status": status}
@@ -95,33 +100,28 @@ class Instant3DGenerator(APIGenerator3D):
 
     def _download_result(self, result_url: str) -> bytes:
         """Download the generated 3D model."""
-        response = self._session.get(result_url, timeout=60)
-        response.raise_for_status()
-        return response.content
+        return stream_download(self._session, result_url, timeout=60)
 
     def _parse_mesh(self, file_data: bytes, format: str = "obj") -> MeshResult:
         """Parse 3D file into MeshResult using trimesh."""
-        try:
-            mesh = trimesh.load(io.BytesIO(file_data), file_type=format)
+        import trimesh
 
-            vertices = [
-                (float(v[0]), float(v[1]), float(v[2])) for v in mesh.vertices
-            ]
-
-            faces = None
-            if hasattr(mesh, "faces") and mesh.faces is not None:
-                faces = [tuple(map(int, face)) for face in mesh.faces]
-
-            normals = None
-            if hasattr(mesh, "vertex_normals") and mesh.vertex_normals is not None:
-                normals = [
-                    (float(n[0]), float(n[1]), float(n[2])) for n in mesh.vertex_normals
-                ]
+        try:
+            mesh = trimesh.load(
+                io.BytesIO(file_data),
+                file_type=format,
+                force="mesh",
+                process=False,
+                maintain_order=True,
+                skip_materials=True,
+            )
 
+            # trimesh already returns contiguous ndarrays; hand them to
+            # MeshResult directly instead of re-boxing every row in Python.
             return MeshResult(
-                vertices=vertices,
-                faces=faces,
-                normals=normals,
+                vertices=mesh.vertices,
+                faces=getattr(mesh, "faces", None),
+                normals=getattr(mesh, "vertex_normals", None),
                 prompt="",
             )
         except Exception as e:
@@ -1,14 +1,15 @@
 """Neural4D API 3D generator implementation."""
 
 import io
+import logging
 import os
 from typing import Optional
 
-import trimesh
-
-from threedllm.generators.api_base import APIGenerator3D
+from threedllm.generators.api_base import APIGenerator3D, dumps_json, loads_json, stream_download
 from threedllm.generators.base import GenerationConfig, MeshResult
 
+logger = logging.getLogger(__name__)
+
 
 class Neural4DGenerator(APIGenerator3D):
     """
@@ -77,18 +78,19 @@ class Neural4DGenerator(APIGenerator3D):
             endpoint = "/" + endpoint
         
         url = f"{self.base_url.rstrip('/')}{endpoint}"
-        print(f"[Neural4D] Submitting to: {url}", flush=True)
-        print(f"[Neural4D] ⚠️  Note: If this fails, you need to configure the correct endpoint from Neural4D's API docs.", flush=True)
+        logger.info("Submitting to: %s", url)
+        logger.debug("If this fails, configure the correct endpoint from Neural4D's API docs.")
         
         try:
             response = self._session.post(
                 url,
-                json=request_data,
+                data=dumps_json(request_data),
+                headers={"Content-Type": "application/json"},
                 timeout=30,
             )
             response.raise_for_status()
 
-            result = response.json()
+            result = loads_json(response.content)
             task_id = result.get("task_id") or result.get("id") or result.get("job_id")
             if not task_id:
                 raise RuntimeError(f"No task ID returned from API. Response: {result}")
@@ -106,7 +108,7 @@ class Neural4DGenerator(APIGenerator3D):
             )
             raise RuntimeError(error_msg) from e
 
-    def _check_status(self, task_id: str) -> dict:
+    def _check_status(self, task_id: str, wait_seconds: float = 0) -> dict:
         """Check Neural4D generation status."""
         # Try common endpoint patterns
         endpoint = os.environ.get("NEURAL4D_STATUS_ENDPOINT", f"/v1/tasks/{task_id}")
@@ -114,16 +116,23 @@ class Neural4DGenerator(APIGenerator3D):
             endpoint = "/" + endpoint
         # Replace {task_id} placeholder if present
         endpoint = endpoint.replace("{task_id}", task_id)
-        
+
         url = f"{self.base_url.rstrip('/')}{endpoint}"
-        
-        response = self._session.get(
+
+        # Ask the server to hold the connection if it supports long-poll;
+        # unsupported values are ignored server-side.
+        wait = int(wait_seconds)
+        response = self._conditional_get(
             url,
-            timeout=10,
+            task_id,
+            params={"wait": wait} if wait > 0 else None,
+            timeout=wait + 10 if wait > 0 else 10,
         )
-        response.raise_for_status()
+        if response is None:
+            # 304: nothing changed since the last poll
+            return {"status": "processing"}
 
-        data = response.json()
+        data = loads_json(response.content)
         status = data.get("status", "pending").lower()
 
         result = {"status": status}
@@ -139,37 +148,29 @@ class Neural4DGenerator(APIGenerator3D):
 
     def _download_result(self, result_url: str) -> bytes:
         """Download the generated 3D model."""
-        response = self._session.get(result_url, timeout=60)
-        response.raise_for_status()
-        return response.content
+        return stream_download(self._session, result_url, timeout=60)
 
     def _parse_mesh(self, file_data: bytes, format: str = "obj") -> MeshResult:
         """Parse 3D file into MeshResult using trimesh."""
+        import trimesh
+
         try:
             # Use trimesh to parse various formats
-            mesh = trimesh.load(io.BytesIO(file_data), file_type=format)
-
-            # Extract vertices
-            vertices = [
-                (float(v[0]), float(v[1]), float(v[2])) for v in mesh.vertices
-            ]
-
-            # Extract faces
-            faces = None
-            if hasattr(mesh, "faces") and mesh.faces is not None:
-                faces = [tuple(map(int, face)) for face in mesh.faces]
-
-            # Extract normals if available
-            normals = None
-            if hasattr(mesh, "vertex_normals") and mesh.vertex_normals is not None:
-                normals = [
-                    (float(n[0]), float(n[1]), float(n[2])) for n in mesh.vertex_normals
-                ]
+            mesh = trimesh.load(
+                io.BytesIO(file_data),
+                file_type=format,
+                force="mesh",
+                process=False,
+                maintain_order=True,
+                skip_materials=True,
+            )
 
+            # trimesh already returns contiguous ndarrays; hand them to
+            # MeshResult directly instead of re-boxing every row in Python.
             return MeshResult(
-                vertices=vertices,
-                faces=faces,
-                normals=normals,
+                vertices=mesh.vertices,
+                faces=getattr(mesh, "faces", None),
+                normals=getattr(mesh, "vertex_normals", None),
                 prompt="",  # Will be set by pipeline
             )
         except Exception as e:
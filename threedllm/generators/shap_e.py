@@ -1,14 +1,42 @@
-"""Shap-E 3D generation backend."""
+"""Shap-E 3D generation backend.
 
-from typing import Optional
+torch and shap_e are imported lazily inside methods so that merely
+importing this module (e.g. from the CLI) stays fast.
+"""
 
-import torch
-from shap_e.diffusion.gaussian_diffusion import diffusion_from_config
-from shap_e.diffusion.sample import sample_latents
-from shap_e.models.download import load_config, load_model
+import functools
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional
 
 from threedllm.generators.base import GenerationConfig, Generator3D, MeshResult
 
+logger = logging.getLogger(__name__)
+
+
+def _weights_cache_dir() -> Path:
+    return Path(os.environ.get("THREEDLLM_MESH_CACHE", Path.home() / ".cache" / "threedllm"))
+
+
+@functools.lru_cache(maxsize=1)
+def _shap_e_available() -> bool:
+    """Whether shap_e and its dependencies import cleanly (cached).
+
+    The probe imports several heavy modules, and installation state
+    doesn't change within a process.
+    """
+    try:
+        import shap_e  # noqa: F401
+        # Try importing key modules to ensure dependencies are available
+        from shap_e.diffusion.gaussian_diffusion import diffusion_from_config  # noqa: F401
+        from shap_e.diffusion.sample import sample_latents  # noqa: F401
+        from shap_e.models.download import load_config, load_model  # noqa: F401
+
+        return True
+    except Exception:
+        return False
+
 
 class ShapEGenerator(Generator3D):
     """Shap-E 3D generation backend."""
@@ -20,7 +48,14 @@ class ShapEGenerator(Generator3D):
         Args:
             device: Device to use ('cuda', 'cpu', or None for auto-detect).
         """
-        self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+        if device is None:
+            try:
+                import torch
+
+                device = "cuda" if torch.cuda.is_available() else "cpu"
+            except ImportError:
+                device = "cpu"
+        self.device = device
         self._text_model = None
         self._decoder_model = None
         self._diffusion = None
@@ -31,94 +66,195 @@ class ShapEGenerator(Generator3D):
         if self._loaded:
             return
 
+        import torch
+        from shap_e.diffusion.gaussian_diffusion import diffusion_from_config
+        from shap_e.models.download import load_config, load_model
+
         device = torch.device(self.device)
-        self._text_model = load_model("text300M", device)
-        self._decoder_model = load_model("decoder", device)
+        if device.type == "cuda":
+            # TF32 matmuls: ~2x faster on Ampere+ with negligible
+            # precision loss for diffusion sampling.
+            torch.backends.cuda.matmul.allow_tf32 = True
+
+        self._text_model = self._load_model_cached("text300M", device)
+        self._decoder_model = self._load_model_cached("decoder", device)
         self._diffusion = diffusion_from_config(load_config("diffusion"))
+
+        # torch.compile (PyTorch 2.x) fuses the transformer's pointwise
+        # ops; fall back silently where compilation is unsupported.
+        if hasattr(torch, "compile"):
+            try:
+                self._text_model = torch.compile(
+                    self._text_model, mode="reduce-overhead", fullgraph=False
+                )
+                self._decoder_model = torch.compile(
+                    self._decoder_model, mode="reduce-overhead", fullgraph=False
+                )
+            except Exception:
+                pass
+
         self._loaded = True
 
-    def is_available(self) -> bool:
-        """Check if Shap-E is available."""
-        try:
-            import shap_e
-            # Try importing key modules to ensure dependencies are available
-            from shap_e.diffusion.gaussian_diffusion import diffusion_from_config
-            from shap_e.diffusion.sample import sample_latents
-            from shap_e.models.download import load_config, load_model
-            # Check if ipywidgets is available (needed for decode_latent_mesh)
+    def _load_model_cached(self, name: str, device):
+        """Load a Shap-E model, memory-mapping cached weights on warm starts.
+
+        The first load goes through shap_e's load_model and saves the
+        state_dict under the threedllm cache dir; later runs build the
+        model skeleton from config and torch.load the weights with
+        mmap=True, which pages them in from the OS cache instead of
+        copying ~GBs through userland. Any cache problem falls back to
+        the normal load.
+        """
+        import torch
+        from shap_e.models.download import load_model
+
+        cache = _weights_cache_dir() / f"shap_e_{name}.pt"
+        if cache.exists():
             try:
-                import ipywidgets
-            except ImportError:
-                # ipywidgets is optional but recommended
+                from shap_e.models.configs import model_from_config
+                from shap_e.models.download import load_config
+
+                model = model_from_config(load_config(name), device)
+                state = torch.load(cache, map_location=device, mmap=True)
+                model.load_state_dict(state)
+                model.eval()
+                return model
+            except Exception:
                 pass
-            return True
-        except (ImportError, Exception):
-            return False
 
-    def generate(
-        self, prompt: str, config: Optional[GenerationConfig] = None
-    ) -> MeshResult:
-        """Generate a 3D mesh using Shap-E."""
-        if not self.is_available():
-            raise RuntimeError("Shap-E is not installed")
+        model = load_model(name, device)
+        try:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            torch.save(model.state_dict(), cache)
+        except OSError:
+            pass
+        return model
 
-        if config is None:
-            config = GenerationConfig()
+    def is_available(self) -> bool:
+        """Check if Shap-E is available."""
+        return _shap_e_available()
 
-        self._load_models()
+    def _sample(self, prompts: List[str], config: GenerationConfig):
+        """Run one diffusion pass producing a latent per prompt."""
+        import torch
+        from shap_e.diffusion.sample import sample_latents
 
         device = torch.device(self.device)
         if config.seed is not None:
             torch.manual_seed(config.seed)
 
-        print(f"Starting Shap-E generation on {device}...", flush=True)
-        print(f"Prompt: {prompt}", flush=True)
-        print(f"Steps: {config.karras_steps}, Guidance: {config.guidance_scale}", flush=True)
-        
+        # Half-precision autocast on CUDA: bf16 (default) keeps fp16's
+        # bandwidth savings with enough dynamic range for sigma_max=160;
+        # "fp32" disables autocast entirely.
+        dtype = {"fp16": torch.float16, "bf16": torch.bfloat16}.get(config.precision)
+        if (
+            dtype is torch.bfloat16
+            and device.type == "cuda"
+            and torch.cuda.get_device_capability(device)[0] < 8
+        ):
+            # Pre-Ampere GPUs (e.g. T4) emulate bf16 far slower than
+            # their native fp16 path; fall back rather than regress them.
+            dtype = torch.float16
+        autocast_enabled = device.type == "cuda" and dtype is not None
+
         # Required parameters for newer versions of shap-e
-        # Default values based on OpenAI's Shap-E implementation
-        latents = sample_latents(
-            batch_size=config.batch_size,
-            model=self._text_model,
-            diffusion=self._diffusion,
-            guidance_scale=config.guidance_scale,
-            model_kwargs={"texts": [prompt]},
-            progress=True,
-            clip_denoised=True,
-            use_fp16=device.type == "cuda",
-            use_karras=True,
-            karras_steps=config.karras_steps,
-            sigma_min=1e-3,  # Minimum noise level (0.001)
-            sigma_max=160.0,  # Maximum noise level
-            s_churn=0.0,  # Stochasticity parameter (0 = deterministic)
-        )
-        
-        print("Latents sampled, decoding mesh...", flush=True)
+        # Default values based on OpenAI's Shap-E implementation.
+        # inference_mode drops autograd bookkeeping entirely (cheaper
+        # than no_grad) — sampling never needs gradients.
+        with torch.inference_mode(), torch.autocast(
+            "cuda", dtype=dtype or torch.float16, enabled=autocast_enabled
+        ):
+            return sample_latents(
+                batch_size=len(prompts),
+                model=self._text_model,
+                diffusion=self._diffusion,
+                guidance_scale=config.guidance_scale,
+                model_kwargs={"texts": prompts},
+                progress=True,
+                clip_denoised=True,
+                use_fp16=device.type == "cuda" and dtype is torch.float16,
+                use_karras=True,
+                karras_steps=config.karras_steps,
+                sigma_min=1e-3,  # Minimum noise level (0.001)
+                sigma_max=160.0,  # Maximum noise level
+                s_churn=0.0,  # Stochasticity parameter (0 = deterministic)
+            )
+
+    def _decode_latent(self, latent, prompt: str) -> MeshResult:
+        """Decode one latent into a MeshResult."""
+        import torch
 
         # Lazy import to avoid ipywidgets dependency at module level
         from shap_e.util.notebooks import decode_latent_mesh
-        mesh = decode_latent_mesh(self._decoder_model, latents[0]).tri_mesh()
-        
-        # TriMesh uses 'verts' not 'vertices'
-        # Handle both tensor and numpy array cases
+
+        with torch.inference_mode():
+            mesh = decode_latent_mesh(self._decoder_model, latent).tri_mesh()
+
+        # TriMesh uses 'verts' not 'vertices'. Move tensors to host memory
+        # and hand the arrays to MeshResult as-is; no per-vertex boxing.
         verts = mesh.verts
         if hasattr(verts, "cpu"):
             verts = verts.cpu().numpy()
-        vertices = [
-            (float(x), float(y), float(z)) for x, y, z in verts
-        ]
-
-        # Extract faces if available
-        faces = None
-        if hasattr(mesh, "faces") and mesh.faces is not None:
-            # Convert faces to list of tuples
-            faces_list = mesh.faces
-            if hasattr(faces_list, "cpu"):
-                faces_list = faces_list.cpu().numpy()
-            faces = [tuple(map(int, face)) for face in faces_list]
+
+        faces = getattr(mesh, "faces", None)
+        if faces is not None and hasattr(faces, "cpu"):
+            faces = faces.cpu().numpy()
 
         return MeshResult(
-            vertices=vertices,
+            vertices=verts,
             faces=faces,
             prompt=prompt,
         )
+
+    def generate(
+        self, prompt: str, config: Optional[GenerationConfig] = None
+    ) -> MeshResult:
+        """Generate a 3D mesh using Shap-E."""
+        if not self.is_available():
+            raise RuntimeError("Shap-E is not installed")
+
+        if config is None:
+            config = GenerationConfig()
+
+        self._load_models()
+
+        logger.info("Starting Shap-E generation on %s", self.device)
+        logger.debug("Prompt: %s", prompt)
+        logger.debug("Steps: %s, Guidance: %s", config.karras_steps, config.guidance_scale)
+
+        latents = self._sample([prompt], config)
+
+        logger.info("Latents sampled, decoding mesh...")
+
+        return self._decode_latent(latents[0], prompt)
+
+    def generate_batch(
+        self, prompts: List[str], config: Optional[GenerationConfig] = None
+    ) -> List[MeshResult]:
+        """Generate meshes for several prompts in one diffusion pass.
+
+        sample_latents conditions on a batch of texts natively, so all N
+        latents ride the GPU's batch dimension through a single Karras
+        loop instead of N serial full passes. Decoding overlaps on a
+        small thread pool — the decoder is mostly GPU MLP evaluation and
+        releases the GIL.
+        """
+        if not self.is_available():
+            raise RuntimeError("Shap-E is not installed")
+        if not prompts:
+            return []
+
+        if config is None:
+            config = GenerationConfig()
+
+        self._load_models()
+
+        latents = self._sample(prompts, config)
+
+        if len(prompts) == 1:
+            return [self._decode_latent(latents[0], prompts[0])]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(4, len(prompts))) as executor:
+            return list(executor.map(self._decode_latent, latents, prompts))
@@ -1,13 +1,24 @@
 """Main pipeline for VLM-enhanced 3D generation."""
 
+import functools
+import hashlib
+import os
+from dataclasses import replace
+from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 from threedllm.exporters.base import Exporter3D
 from threedllm.exporters.xyz import XYZExporter
 from threedllm.generators.base import GenerationConfig, Generator3D, MeshResult
 from threedllm.vlm.base import VLMProvider
 
 
+def _default_cache_dir() -> Path:
+    return Path(os.environ.get("THREEDLLM_MESH_CACHE", Path.home() / ".cache" / "threedllm"))
+
+
 class ThreeDPipeline:
     """Main pipeline for generating 3D objects from prompts using VLM enhancement."""
 
@@ -16,6 +27,7 @@ class ThreeDPipeline:
         generator: Generator3D,
         vlm: Optional[VLMProvider] = None,
         exporter: Optional[Exporter3D] = None,
+        use_cache: bool = True,
     ):
         """
         Initialize the pipeline.
@@ -24,10 +36,60 @@ class ThreeDPipeline:
             generator: 3D generation backend.
             vlm: Optional VLM provider for prompt enhancement.
             exporter: Optional exporter (defaults to XYZExporter).
+            use_cache: Cache generated meshes on disk keyed by prompt and
+                config, so repeating a prompt skips the API/model round
+                trip. Directory defaults to ~/.cache/threedllm (override
+                with THREEDLLM_MESH_CACHE).
         """
         self.generator = generator
         self.vlm = vlm
         self.exporter = exporter or XYZExporter()
+        self.use_cache = use_cache
+        self.cache_dir = _default_cache_dir()
+        # Per-instance LRU over VLM enhancements: re-running the same
+        # prompt skips a 0.5-2s paid LLM round trip.
+        self._enhance_cached = functools.lru_cache(maxsize=256)(self._enhance_prompt)
+
+    def _enhance_prompt(self, prompt: str, image_key: Optional[tuple]):
+        """Call the VLM; cached via self._enhance_cached.
+
+        image_key is (path, mtime_ns, size) so a changed image file
+        invalidates the cached enhancement.
+        """
+        image_path = image_key[0] if image_key else None
+        if image_path:
+            return self.vlm.enhance_prompt(prompt, image_path=image_path)
+        return self.vlm.enhance_prompt(prompt)
+
+    def _cache_path(self, prompt: str, config: Optional[GenerationConfig]) -> Path:
+        """Content-addressed .npz path for a (prompt, config, backend) triple."""
+        key = hashlib.sha256(
+            f"{prompt}|{config!r}|{type(self.generator).__name__}".encode("utf-8")
+        ).hexdigest()
+        return self.cache_dir / f"{key}.npz"
+
+    def _load_cached(self, path: Path) -> Optional[MeshResult]:
+        """Load a cached mesh, tolerating a missing or corrupt file."""
+        try:
+            with np.load(path) as data:
+                return MeshResult(
+                    vertices=data["vertices"],
+                    faces=data["faces"] if "faces" in data.files else None,
+                    normals=data["normals"] if "normals" in data.files else None,
+                    prompt=str(data["prompt"]),
+                )
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def _store_cached(self, path: Path, result: MeshResult) -> None:
+        """Write a mesh to the cache as compressed binary SoA arrays."""
+        arrays = {"vertices": result.vertices, "prompt": np.array(result.prompt)}
+        if result.faces is not None:
+            arrays["faces"] = result.faces
+        if result.normals is not None:
+            arrays["normals"] = result.normals
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(path, **arrays)
 
     def generate(
         self,
@@ -48,12 +110,29 @@ class ThreeDPipeline:
         Returns:
             MeshResult containing the generated mesh.
         """
+        # The key must record whether enhancement will actually run —
+        # the same predicate as the branch below — or a configured-but-
+        # unavailable VLM would store un-enhanced meshes under vlm=True
+        # and serve them to enhanced requests forever.
+        enhance = bool(use_vlm and self.vlm and self.vlm.is_available())
+
+        # Serve repeat prompts from the mesh cache: a disk read instead
+        # of a full API/model generation. Image-conditioned requests are
+        # not cached since the key cannot capture the image contents.
+        cache_path = None
+        if self.use_cache and image_path is None:
+            cache_path = self._cache_path(f"{prompt}|vlm={enhance}", config)
+            cached = self._load_cached(cache_path)
+            if cached is not None:
+                return cached
+
         # Enhance prompt with VLM if available
-        if use_vlm and self.vlm and self.vlm.is_available():
+        if enhance:
+            image_key = None
             if image_path:
-                vlm_response = self.vlm.enhance_prompt(prompt, image_path=image_path)
-            else:
-                vlm_response = self.vlm.enhance_prompt(prompt)
+                stat = os.stat(image_path)
+                image_key = (image_path, stat.st_mtime_ns, stat.st_size)
+            vlm_response = self._enhance_cached(prompt, image_key)
             enhanced_prompt = vlm_response.text
             print(f"VLM enhanced prompt: {enhanced_prompt}")
         else:
@@ -63,8 +142,53 @@ class ThreeDPipeline:
         result = self.generator.generate(enhanced_prompt, config)
         result.prompt = enhanced_prompt  # Store the actual prompt used
 
+        if cache_path is not None:
+            self._store_cached(cache_path, result)
+
         return result
 
+    def generate_many(
+        self,
+        prompts: list,
+        image_paths: Optional[list] = None,
+        use_vlm: bool = True,
+        config: Optional[GenerationConfig] = None,
+        max_workers: int = 8,
+    ) -> list:
+        """
+        Generate meshes for several prompts concurrently.
+
+        API-backed generators are I/O bound, so prompts fan out over a
+        thread pool and total wall time approaches the slowest job.
+        Local GPU generators (Shap-E) run with a single worker: the GPU
+        serializes the work anyway, and concurrent model invocations
+        just thrash VRAM.
+
+        Args:
+            prompts: Input text prompts.
+            image_paths: Optional per-prompt image paths for VLM enhancement.
+            use_vlm: Whether to use VLM for prompt enhancement.
+            config: Optional generation configuration shared by the batch.
+            max_workers: Thread count for API-backed generators.
+
+        Returns:
+            MeshResults in the same order as the prompts.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        if image_paths is None:
+            image_paths = [None] * len(prompts)
+
+        if type(self.generator).__name__ == "ShapEGenerator":
+            max_workers = 1
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.generate, prompt, image_path, use_vlm, config)
+                for prompt, image_path in zip(prompts, image_paths)
+            ]
+            return [future.result() for future in futures]
+
     def generate_and_export(
         self,
         prompt: str,
@@ -86,6 +210,10 @@ class ThreeDPipeline:
         Returns:
             MeshResult containing the generated mesh.
         """
+        if isinstance(self.exporter, XYZExporter):
+            # XYZ keeps only the points, so let file-parsing backends
+            # skip faces and normals entirely.
+            config = replace(config or GenerationConfig(), vertices_only=True)
         result = self.generate(prompt, image_path, use_vlm, config)
         self.exporter.export(result, output_path)
         return result
@@ -2,13 +2,43 @@
 
 from typing import Optional
 
+import numpy as np
+
 from threedllm.generators.base import MeshResult
 
+# Cached pyplot module; populated on first use by _get_pyplot.
+_plt = None
+
+
+def _get_pyplot(interactive: bool):
+    """Import and cache matplotlib.pyplot.
+
+    For non-interactive use the Agg backend is selected before pyplot is
+    imported, skipping the Qt/Tk backend probe entirely — the bulk of
+    matplotlib's startup cost for batch exports.
+    """
+    global _plt
+    if _plt is None:
+        try:
+            import matplotlib
+
+            if not interactive:
+                matplotlib.use("Agg")
+            import matplotlib.pyplot as plt
+            from mpl_toolkits.mplot3d import Axes3D  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                "matplotlib is required for visualization. Install with: pip install matplotlib"
+            )
+        _plt = plt
+    return _plt
+
 
 def visualize_mesh(
     result: MeshResult,
     output_path: Optional[str] = None,
     show: bool = True,
+    max_points: int = 50_000,
 ) -> None:
     """
     Visualize a 3D mesh using matplotlib.
@@ -17,22 +47,29 @@ def visualize_mesh(
         result: Mesh result to visualize.
         output_path: Optional path to save the visualization.
         show: Whether to display the plot interactively.
+        max_points: Subsample the cloud to at most this many points
+            before plotting; matplotlib's 3D scatter degrades badly past
+            ~100k points while the plot only resolves ~1M pixels anyway.
     """
-    try:
-        import matplotlib.pyplot as plt
-        from mpl_toolkits.mplot3d import Axes3D
-    except ImportError:
-        raise ImportError(
-            "matplotlib is required for visualization. Install with: pip install matplotlib"
-        )
+    plt = _get_pyplot(interactive=show)
 
     fig = plt.figure(figsize=(10, 8))
     ax = fig.add_subplot(111, projection="3d")
 
-    # Extract coordinates
-    x = [v[0] for v in result.vertices]
-    y = [v[1] for v in result.vertices]
-    z = [v[2] for v in result.vertices]
+    # Whole-column slices and one vectorized min/max pass instead of
+    # three list comprehensions plus six Python-level scans.
+    verts = np.asarray(result.vertices, dtype=np.float32).reshape(-1, 3)
+
+    # Bounding box from the full cloud, before any decimation
+    mn = verts.min(axis=0)
+    mx = verts.max(axis=0)
+
+    if max_points and len(verts) > max_points:
+        # Uniform subsample; a fixed seed keeps repeated renders stable
+        idx = np.random.default_rng(0).choice(len(verts), max_points, replace=False)
+        verts = verts[idx]
+
+    x, y, z = verts[:, 0], verts[:, 1], verts[:, 2]
 
     # Plot vertices
     ax.scatter(x, y, z, c=z, cmap="viridis", s=1, alpha=0.6)
@@ -44,17 +81,11 @@ def visualize_mesh(
     ax.set_title(f"3D Mesh: {result.prompt[:50]}...")
 
     # Equal aspect ratio
-    max_range = max(
-        max(x) - min(x),
-        max(y) - min(y),
-        max(z) - min(z),
-    ) / 2.0
-    mid_x = (max(x) + min(x)) * 0.5
-    mid_y = (max(y) + min(y)) * 0.5
-    mid_z = (max(z) + min(z)) * 0.5
-    ax.set_xlim(mid_x - max_range, mid_x + max_range)
-    ax.set_ylim(mid_y - max_range, mid_y + max_range)
-    ax.set_zlim(mid_z - max_range, mid_z + max_range)
+    mid = (mn + mx) * 0.5
+    half = float((mx - mn).max()) * 0.5
+    ax.set_xlim(mid[0] - half, mid[0] + half)
+    ax.set_ylim(mid[1] - half, mid[1] + half)
+    ax.set_zlim(mid[2] - half, mid[2] + half)
 
     if output_path:
         plt.savefig(output_path, dpi=150, bbox_inches="tight")
@@ -71,18 +102,18 @@ def print_mesh_info(result: MeshResult) -> None:
     print(f"\nMesh Information:")
     print(f"  Prompt: {result.prompt}")
     print(f"  Vertices: {len(result.vertices)}")
-    if result.faces:
+    if result.faces is not None:
         print(f"  Faces: {len(result.faces)}")
     else:
         print(f"  Faces: None (point cloud)")
 
-    if result.vertices:
-        # Calculate bounding box
-        x_coords = [v[0] for v in result.vertices]
-        y_coords = [v[1] for v in result.vertices]
-        z_coords = [v[2] for v in result.vertices]
+    if len(result.vertices) > 0:
+        # Calculate bounding box in one vectorized pass per extreme
+        verts = np.asarray(result.vertices, dtype=np.float32).reshape(-1, 3)
+        mn = verts.min(axis=0)
+        mx = verts.max(axis=0)
 
         print(f"  Bounding Box:")
-        print(f"    X: [{min(x_coords):.3f}, {max(x_coords):.3f}]")
-        print(f"    Y: [{min(y_coords):.3f}, {max(y_coords):.3f}]")
-        print(f"    Z: [{min(z_coords):.3f}, {max(z_coords):.3f}]")
+        print(f"    X: [{mn[0]:.3f}, {mx[0]:.3f}]")
+        print(f"    Y: [{mn[1]:.3f}, {mx[1]:.3f}]")
+        print(f"    Z: [{mn[2]:.3f}, {mx[2]:.3f}]")
@@ -1,5 +1,6 @@
 """Base interfaces for Vision Language Model providers."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
@@ -40,7 +41,79 @@ class VLMProvider(ABC):
         """
         pass
 
-    @abstractmethod
+    async def enhance_prompt_async(
+        self,
+        prompt: str,
+        image_path: Optional[str] = None,
+        system_prompt: Optional[str] = None,
+    ) -> VLMResponse:
+        """
+        Async variant of :meth:`enhance_prompt`.
+
+        The default implementation runs the synchronous call in a worker
+        thread so the event loop is not blocked. Providers with a native
+        async client should override this.
+        """
+        return await asyncio.to_thread(
+            self.enhance_prompt, prompt, image_path, system_prompt
+        )
+
+    async def enhance_prompts_batch(
+        self,
+        prompts: list,
+        image_paths: Optional[list] = None,
+        system_prompt: Optional[str] = None,
+        max_concurrency: int = 8,
+    ) -> list:
+        """
+        Enhance several prompts concurrently.
+
+        Fans out over :meth:`enhance_prompt_async` with a semaphore
+        capping in-flight requests, so a bulk run overlaps the network
+        round trips instead of serializing them.
+
+        Args:
+            prompts: Input text prompts.
+            image_paths: Optional per-prompt image paths.
+            system_prompt: Optional system prompt shared by the batch.
+            max_concurrency: Maximum concurrent requests.
+
+        Returns:
+            VLMResponses in the same order as the prompts.
+        """
+        if image_paths is None:
+            image_paths = [None] * len(prompts)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def one(prompt, image_path):
+            async with semaphore:
+                return await self.enhance_prompt_async(prompt, image_path, system_prompt)
+
+        return list(
+            await asyncio.gather(
+                *(one(prompt, path) for prompt, path in zip(prompts, image_paths))
+            )
+        )
+
+    # Cached availability; populated on first is_available() call.
+    _available: Optional[bool] = None
+
     def is_available(self) -> bool:
-        """Check if the provider is available (e.g., API key configured)."""
+        """Check if the provider is available (e.g., API key configured).
+
+        The probe result is cached — some providers ping an API or load
+        a model to answer, and the pipeline asks on every generate().
+        Call :meth:`refresh` after changing credentials.
+        """
+        if self._available is None:
+            self._available = self._check_available()
+        return self._available
+
+    def refresh(self) -> None:
+        """Drop the cached availability so the next check re-probes."""
+        self._available = None
+
+    @abstractmethod
+    def _check_available(self) -> bool:
+        """Probe whether the provider can serve requests."""
         pass
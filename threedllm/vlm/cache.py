@@ -0,0 +1,81 @@
+"""Disk cache for VLM prompt enhancements.
+
+Enhancement calls are paid LLM round trips of 0.5-2s; repeating a
+(prompt, image, model) triple is common in iterative use, so responses
+are kept in a small sqlite database under the threedllm cache dir.
+"""
+
+import hashlib
+import os
+import sqlite3
+from pathlib import Path
+from typing import Optional, Tuple
+
+
+def default_cache_path() -> Path:
+    base = Path(os.environ.get("THREEDLLM_MESH_CACHE", Path.home() / ".cache" / "threedllm"))
+    return base / "vlm.sqlite"
+
+
+def make_key(
+    prompt: str,
+    model: str,
+    system_prompt: Optional[str] = None,
+    image_path: Optional[str] = None,
+) -> str:
+    """Exact-match cache key for an enhancement request.
+
+    Images enter the key as (path, mtime, size) so an edited file
+    invalidates the entry without re-reading its bytes.
+    """
+    parts = [prompt, model, system_prompt or ""]
+    if image_path:
+        try:
+            stat = os.stat(image_path)
+            parts.append(f"{image_path}|{stat.st_mtime_ns}|{stat.st_size}")
+        except OSError:
+            parts.append(image_path)
+    return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+
+
+class PromptCache:
+    """Keyed store of enhanced prompts; safe to share across threads.
+
+    A connection is opened per operation — negligible next to the LLM
+    round trip a hit avoids, and it sidesteps sqlite's per-thread
+    connection rule.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else default_cache_path()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, text TEXT NOT NULL, tokens INTEGER)"
+        )
+        return conn
+
+    def get(self, key: str) -> Optional[Tuple[str, Optional[int]]]:
+        """Return (text, tokens_used) for a key, or None on a miss."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT text, tokens FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return (row[0], row[1]) if row else None
+
+    def put(self, key: str, text: str, tokens_used: Optional[int] = None) -> None:
+        """Store a response; cache errors are swallowed, never raised."""
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, text, tokens) VALUES (?, ?, ?)",
+                    (key, text, tokens_used),
+                )
+        except sqlite3.Error:
+            pass
@@ -8,14 +8,16 @@ uses an image) before generating a mesh with Shap-E and exporting sampled XYZ po
 from __future__ import annotations
 
 import argparse
-import base64
+import asyncio
+import functools
+import hashlib
 import json
 import os
-import random
-import urllib.request
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Iterable, List, Sequence, Tuple
 
+import numpy as np
 import torch
 from shap_e.diffusion.gaussian_diffusion import diffusion_from_config
 from shap_e.diffusion.sample import sample_latents
@@ -24,11 +26,20 @@ from shap_e.util.notebooks import decode_latent_mesh
 
 Point = Tuple[float, float, float]
 
+# Static instruction kept byte-identical across calls and placed before
+# any dynamic content, so provider-side prompt caching can reuse the
+# prefix (caches only hit on exact prefix matches).
+VLM_INSTRUCTION = (
+    "Create a concise 3D-friendly prompt describing a single object. "
+    "Emphasize shape and material, avoid scenes."
+)
+
 
 @dataclass(frozen=True)
 class GenerationResult:
     prompt: str
-    points: List[Point]
+    points: np.ndarray
+    """Sampled points as an (N, 3) float32 array."""
 
 
 def build_output_path(word: str, output: str | None) -> str:
@@ -39,57 +50,79 @@ def build_output_path(word: str, output: str | None) -> str:
 
 
 def write_xyz(path: str, prompt: str, points: Sequence[Point]) -> None:
+    """Write the point cloud with one bulk format pass.
+
+    np.savetxt formats all rows in C instead of three f-strings and a
+    write call per point.
+    """
+    arr = np.asarray(points, dtype=np.float32).reshape(-1, 3)
     with open(path, "w", encoding="utf-8") as handle:
-        handle.write(f"{len(points)}\n")
-        handle.write(f"prompt={prompt}\n")
-        for x, y, z in points:
-            handle.write(f"{x:.6f} {y:.6f} {z:.6f}\n")
+        handle.write(f"{len(arr)}\nprompt={prompt}\n")
+        np.savetxt(handle, arr, fmt="%.6f %.6f %.6f")
 
 
-def sample_points(vertices: Iterable[Point], count: int, seed: int | None) -> List[Point]:
-    verts = list(vertices)
-    if not verts:
+def sample_points(vertices: Iterable[Point], count: int, seed: int | None) -> np.ndarray:
+    """Sample points as an (N, 3) array, staying in NumPy throughout.
+
+    The previous list-of-tuples + random.sample version paid Python
+    object overhead per vertex; choosing indices vectorized keeps a
+    100k-vertex mesh out of the interpreter entirely.
+    """
+    arr = np.asarray(vertices, dtype=np.float32).reshape(-1, 3)
+    if arr.shape[0] == 0:
         raise ValueError("No vertices available to sample from the mesh.")
-    rng = random.Random(seed)
     if count <= 0:
         raise ValueError("--points must be a positive integer")
-    if count >= len(verts):
-        return verts
-    return rng.sample(verts, count)
+    if count >= arr.shape[0]:
+        return arr
+    rng = np.random.default_rng(seed)
+    idx = rng.choice(arr.shape[0], size=count, replace=False)
+    return arr[idx]
 
 
 def build_vlm_request(prompt: str, image_path: str | None) -> dict:
     content = [{"type": "input_text", "text": prompt}]
     if image_path:
-        with open(image_path, "rb") as image_handle:
-            encoded = base64.b64encode(image_handle.read()).decode("utf-8")
+        from threedllm.vlm.images import encode_data_url, prepare_image
+
+        image_data, mime_type = prepare_image(image_path)
+        image_url = encode_data_url(image_data, mime_type)
         content.append(
             {
                 "type": "input_image",
-                "image_url": f"data:image/png;base64,{encoded}",
+                "image_url": image_url,
             }
         )
     return {
         "model": "gpt-4o-mini",
         "input": [
+            {
+                "role": "system",
+                "content": [{"type": "input_text", "text": VLM_INSTRUCTION}],
+            },
             {
                 "role": "user",
-                "content": [
-                    {
-                        "type": "input_text",
-                        "text": (
-                            "Create a concise 3D-friendly prompt describing a single object. "
-                            "Emphasize shape and material, avoid scenes."
-                        ),
-                    },
-                    *content,
-                ],
-            }
+                "content": content,
+            },
         ],
         "max_output_tokens": 200,
     }
 
 
+# Shared HTTP client so every VLM call reuses one warm TLS connection
+# instead of paying a fresh TCP+TLS handshake per request.
+_http_client = None
+
+
+def _get_http_client():
+    global _http_client
+    if _http_client is None:
+        from threedllm.generators.api_base import create_http_session
+
+        _http_client = create_http_session()
+    return _http_client
+
+
 def call_vlm(
     prompt: str,
     image_path: str | None,
@@ -97,28 +130,104 @@ def call_vlm(
     endpoint: str,
     model: str,
 ) -> str:
+    from threedllm.vlm.cache import PromptCache, make_key
+
+    cache = PromptCache()
+    cache_key = make_key(prompt, model, image_path=image_path)
+    hit = cache.get(cache_key)
+    if hit is not None:
+        return hit[0]
+
     payload = build_vlm_request(prompt, image_path)
     payload["model"] = model
     body = json.dumps(payload).encode("utf-8")
-    request = urllib.request.Request(
-        endpoint,
-        data=body,
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        },
-        method="POST",
-    )
-    with urllib.request.urlopen(request) as response:
-        data = json.loads(response.read().decode("utf-8"))
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+    }
+    from threedllm.generators.api_base import post_with_retries
+
+    response = post_with_retries(_get_http_client(), endpoint, body, headers)
+    if response.status_code >= 400:
+        raise RuntimeError(f"VLM API error: {response.text}")
+    data = json.loads(response.content)
     output_text = data.get("output_text")
-    if output_text:
-        return output_text.strip()
-    for item in data.get("output", []):
-        for content in item.get("content", []):
-            if content.get("type") == "output_text":
-                return content.get("text", "").strip()
-    raise RuntimeError("No output_text found in VLM response.")
+    if not output_text:
+        for item in data.get("output", []):
+            for content in item.get("content", []):
+                if content.get("type") == "output_text":
+                    output_text = content.get("text", "")
+                    break
+            if output_text:
+                break
+    if not output_text:
+        raise RuntimeError("No output_text found in VLM response.")
+    output_text = output_text.strip()
+    cache.put(cache_key, output_text)
+    return output_text
+
+
+def call_vlm_batch(
+    prompts: Sequence[str],
+    image_path: str | None,
+    api_key: str,
+    endpoint: str,
+    model: str,
+    max_concurrency: int = 8,
+) -> List[str]:
+    """Enhance several prompts with overlapping round trips.
+
+    Each call is an independent network request, so a bulk run gathers
+    them concurrently (capped by a semaphore) instead of paying the API
+    latency once per word.
+    """
+
+    async def run() -> List[str]:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def one(prompt: str) -> str:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    call_vlm, prompt, image_path, api_key, endpoint, model
+                )
+
+        return list(await asyncio.gather(*(one(prompt) for prompt in prompts)))
+
+    return asyncio.run(run())
+
+
+@functools.lru_cache(maxsize=None)
+def _load_models(device_str: str):
+    """Load the Shap-E models once per device and reuse them.
+
+    Each load_model call reads multi-hundred-MB weights from disk; for a
+    multi-word run that cost only needs paying once.
+    """
+    device = torch.device(device_str)
+    text_model = load_model("text300M", device)
+    decoder_model = load_model("decoder", device)
+    diffusion = diffusion_from_config(load_config("diffusion"))
+    # torch.compile fuses the transformer's pointwise ops; skip silently
+    # where compilation is unsupported. Compiling here means the warmup
+    # cost is also paid once per device, like the loads.
+    if hasattr(torch, "compile"):
+        try:
+            text_model = torch.compile(text_model, mode="reduce-overhead")
+            decoder_model = torch.compile(decoder_model, mode="reduce-overhead")
+        except Exception:
+            pass
+    return text_model, decoder_model, diffusion
+
+
+def _cache_root() -> Path:
+    return Path(
+        os.environ.get("THREEDLLM_MESH_CACHE", Path.home() / ".cache" / "threedllm")
+    )
+
+
+def _use_bf16(device: torch.device) -> bool:
+    """Whether to autocast to bfloat16 (Ampere+ tensor cores)."""
+    return device.type == "cuda" and torch.cuda.get_device_capability()[0] >= 8
 
 
 def generate_mesh_vertices(
@@ -126,31 +235,85 @@ def generate_mesh_vertices(
     guidance_scale: float,
     karras_steps: int,
     seed: int | None,
-) -> List[Point]:
+) -> np.ndarray:
     device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+
+    # Seeded runs are deterministic, so both the sampled latents and the
+    # decoded vertices can be reused from disk — a repeat word skips the
+    # 64-step Karras loop entirely. Unseeded runs are never cached.
+    mesh_path = latents_path = None
+    latents = None
     if seed is not None:
-        torch.manual_seed(seed)
+        key = hashlib.sha256(
+            f"{prompt}|{guidance_scale}|{karras_steps}|{seed}".encode("utf-8")
+        ).hexdigest()
+        mesh_path = _cache_root() / "meshes" / f"{key}.npy"
+        if mesh_path.exists():
+            try:
+                return np.load(mesh_path)
+            except (OSError, ValueError):
+                pass
+        latents_path = _cache_root() / "latents" / f"{key}.pt"
+        if latents_path.exists():
+            try:
+                latents = torch.load(latents_path, map_location=device)
+            except Exception:
+                latents = None
 
-    text_model = load_model("text300M", device)
-    decoder_model = load_model("decoder", device)
-    diffusion = diffusion_from_config(load_config("diffusion"))
+    text_model, decoder_model, diffusion = _load_models(str(device))
 
-    latents = sample_latents(
-        batch_size=1,
-        model=text_model,
-        diffusion=diffusion,
-        guidance_scale=guidance_scale,
-        model_kwargs={"texts": [prompt]},
-        progress=True,
-        clip_denoised=True,
-        use_fp16=device.type == "cuda",
-        use_karras=True,
-        karras_steps=karras_steps,
-    )
+    # bf16 autocast halves memory bandwidth — the dominant cost of the
+    # Karras loop — with enough range for the noise schedule; pre-Ampere
+    # CUDA falls back to shap_e's own fp16 path.
+    bf16 = _use_bf16(device)
+    if latents is None:
+        # Seed inside fork_rng: sample_latents has no generator kwarg, so
+        # this scopes the reseed to the call instead of mutating the global
+        # (CPU and CUDA) RNG state for everything else in the process.
+        rng_devices = [device] if device.type == "cuda" else []
+        with torch.random.fork_rng(devices=rng_devices, enabled=seed is not None):
+            if seed is not None:
+                torch.manual_seed(seed)
+            with torch.inference_mode(), torch.autocast(
+                "cuda", dtype=torch.bfloat16, enabled=bf16
+            ):
+                latents = sample_latents(
+                    batch_size=1,
+                    model=text_model,
+                    diffusion=diffusion,
+                    guidance_scale=guidance_scale,
+                    model_kwargs={"texts": [prompt]},
+                    progress=True,
+                    clip_denoised=True,
+                    use_fp16=device.type == "cuda" and not bf16,
+                    use_karras=True,
+                    karras_steps=karras_steps,
+                )
+        if latents_path is not None:
+            try:
+                latents_path.parent.mkdir(parents=True, exist_ok=True)
+                torch.save(latents, latents_path)
+            except OSError:
+                pass
 
-    mesh = decode_latent_mesh(decoder_model, latents[0]).tri_mesh()
-    vertices = mesh.vertices
-    return [(float(x), float(y), float(z)) for x, y, z in vertices]
+    with torch.inference_mode(), torch.autocast(
+        "cuda", dtype=torch.bfloat16, enabled=bf16
+    ):
+        mesh = decode_latent_mesh(decoder_model, latents[0]).tri_mesh()
+    # Hand the vertex array straight through — float()-ing and tupling
+    # each vertex in Python is 3N interpreter calls for nothing;
+    # sample_points and write_xyz consume the ndarray as-is.
+    verts = mesh.vertices
+    if hasattr(verts, "cpu"):
+        verts = verts.cpu().numpy()
+    verts = np.asarray(verts, dtype=np.float32).reshape(-1, 3)
+    if mesh_path is not None:
+        try:
+            mesh_path.parent.mkdir(parents=True, exist_ok=True)
+            np.save(mesh_path, verts)
+        except OSError:
+            pass
+    return verts
 
 
 def build_point_cloud(
@@ -165,11 +328,39 @@ def build_point_cloud(
     return GenerationResult(prompt=prompt, points=points)
 
 
+def _valid_image_path(path: str) -> str:
+    """argparse type check for --image.
+
+    A bad path used to surface only after the multi-second Shap-E model
+    load, when the request body was built; checking here fails in
+    milliseconds instead. Pillow (optional) additionally verifies the
+    file decodes as an image.
+    """
+    try:
+        os.stat(path)
+    except OSError as exc:
+        raise argparse.ArgumentTypeError(f"cannot read image {path!r}: {exc}")
+    try:
+        from PIL import Image
+    except ImportError:
+        return path
+    try:
+        with Image.open(path) as img:
+            img.verify()
+    except Exception as exc:
+        raise argparse.ArgumentTypeError(f"{path!r} is not a valid image: {exc}")
+    return path
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Generate a 3D point cloud from a word using VLM + Shap-E."
     )
-    parser.add_argument("word", help="Word or short phrase to generate.")
+    parser.add_argument(
+        "word",
+        nargs="+",
+        help="Word(s) or short phrase(s) to generate, one point cloud each.",
+    )
     parser.add_argument(
         "--points",
         type=int,
@@ -199,6 +390,7 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--image",
+        type=_valid_image_path,
         help="Optional image path to send to the multimodal model.",
     )
     parser.add_argument(
@@ -221,31 +413,36 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = parse_args()
-    prompt = args.word.strip()
+    words = [word.strip() for word in args.word]
+    if args.output and len(words) > 1:
+        raise SystemExit("--output only applies when generating a single word")
+    prompts = list(words)
     use_vlm = args.use_vlm or bool(args.image)
     if use_vlm:
         api_key = os.environ.get("OPENAI_API_KEY")
         if not api_key:
             raise SystemExit("OPENAI_API_KEY is required when using --use-vlm or --image")
-        prompt = call_vlm(
-            prompt=prompt,
+        prompts = call_vlm_batch(
+            prompts,
             image_path=args.image,
             api_key=api_key,
             endpoint=args.vlm_endpoint,
             model=args.vlm_model,
         )
-        print(f"VLM prompt: {prompt}")
-    result = build_point_cloud(
-        prompt,
-        point_count=args.points,
-        guidance_scale=args.guidance_scale,
-        karras_steps=args.karras_steps,
-        seed=args.seed,
-    )
-    output_path = build_output_path(args.word, args.output)
-    write_xyz(output_path, result.prompt, result.points)
-    print(f"Generated {len(result.points)} points for '{result.prompt}'.")
-    print(f"Saved XYZ file to: {output_path}")
+        for prompt in prompts:
+            print(f"VLM prompt: {prompt}")
+    for word, prompt in zip(words, prompts):
+        result = build_point_cloud(
+            prompt,
+            point_count=args.points,
+            guidance_scale=args.guidance_scale,
+            karras_steps=args.karras_steps,
+            seed=args.seed,
+        )
+        output_path = build_output_path(word, args.output)
+        write_xyz(output_path, result.prompt, result.points)
+        print(f"Generated {len(result.points)} points for '{result.prompt}'.")
+        print(f"Saved XYZ file to: {output_path}")
 
 
 if __name__ == "__main__":